@@ -0,0 +1,561 @@
+import argparse
+import asyncio
+import collections
+import contextlib
+import csv
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Iterator, List, Sequence, Tuple
+
+import timing
+from task2 import (AsyncLibrary, Book, BookTable, DeleteIndex, LibraryManager, edit_distance, iter_csv_books,
+                   iter_json_books)
+
+
+class LegacyBook:
+    """The original dict-backed Book, kept as the memory/search baseline."""
+
+    def __init__(self, title: str, author: str):
+        self.title = title
+        self.author = author
+
+
+def legacy_linear_search(books: Sequence[LegacyBook], keyword: str) -> List[LegacyBook]:
+    """The original linear_search loop: lowercase both fields of every book on every query."""
+    keyword_lower = keyword.lower()
+    return [book for book in books if keyword_lower in book.title.lower() or keyword_lower in book.author.lower()]
+
+
+SYLLABLES = ["an", "ber", "cal", "dor", "el", "fin", "gar", "hol", "is", "jor", "kel", "lan", "mor",
+             "nel", "or", "pra", "quin", "ros", "sta", "tur", "ul", "vin", "wes", "xan", "yor", "zen"]
+
+
+def table_linear_search(books: BookTable, keyword: str) -> List[Book]:
+    """The scan LibraryManager.linear_search runs: C-level passes over the lowercase lists, building only hits."""
+    return [books[i] for i in books.ids_containing(keyword.lower())]
+
+
+def build_table(rows: Sequence[Tuple[bytes, bytes]]) -> BookTable:
+    table = BookTable()
+    for title, author in rows:
+        table.append(title.decode(), author.decode())
+    table.flush()
+    return table
+
+
+def make_word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4)))
+
+
+def make_token(rng: random.Random) -> str:
+    """A 3-12 letter pronounceable token; far more varied than make_word's 26 syllables."""
+    consonants, vowels = "bcdfghjklmnprstvwyz", "aeiou"
+    word = "".join(rng.choice(consonants) + rng.choice(vowels) for _ in range(6))
+    return word[:rng.randint(3, 12)]
+
+
+def make_typo(rng: random.Random, word: str, edits: int) -> str:
+    """word with the given number of random insertions, deletions, substitutions or swaps."""
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    for _ in range(edits):
+        i = rng.randrange(len(word))
+        kind = rng.randrange(4)
+        if kind == 0:
+            word = word[:i] + rng.choice(letters) + word[i:]
+        elif kind == 1 and len(word) > 1:
+            word = word[:i] + word[i + 1:]
+        elif kind == 2 or i + 1 >= len(word):
+            word = word[:i] + rng.choice(letters.replace(word[i], "")) + word[i + 1:]
+        else:
+            word = word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    return word
+
+
+def iter_catalog(n: int, seed: int, vocab_size: int = 50_000, num_authors: int = 100_000) -> Iterator[Tuple[str, str]]:
+    """Reproducible (title, author) pairs: 2-6 word titles over a Zipf-ish vocabulary, random author names."""
+    rng = random.Random(seed)
+    vocab = [make_word(rng).capitalize() for _ in range(vocab_size)]
+    cum_weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(vocab_size)))
+    authors = [f"{make_word(rng).capitalize()} {make_word(rng).capitalize()}" for _ in range(num_authors)]
+    for _ in range(n):
+        title = " ".join(rng.choices(vocab, cum_weights=cum_weights, k=rng.randint(2, 6)))
+        yield title, rng.choice(authors)
+
+
+def make_catalog(n: int, seed: int, vocab_size: int = 50_000, num_authors: int = 100_000) -> List[Tuple[str, str]]:
+    return list(iter_catalog(n, seed, vocab_size, num_authors))
+
+
+def make_query_stream(catalog: Sequence[Tuple[str, str]], rng: random.Random, distinct: int,
+                      queries: int) -> Tuple[List[str], List[str]]:
+    """distinct keywords (title words and author names) and a Zipf-weighted stream of queries over them."""
+    keywords = list(dict.fromkeys(rng.choice(rng.choice(catalog)[rng.randrange(2)].split())
+                                  for _ in range(distinct * 2)))[:distinct]
+    cum_weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(len(keywords))))
+    return keywords, rng.choices(keywords, cum_weights=cum_weights, k=queries)
+
+
+def build_library(catalog: Sequence[Tuple[str, str]]) -> LibraryManager:
+    library = LibraryManager()
+    for title, author in catalog:
+        library.add_book(title, author)
+    return library
+
+
+def time_call(fn: Callable):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    return sorted_values[min(len(sorted_values) - 1, int(q / 100 * len(sorted_values)))]
+
+
+def bench_autocomplete(sizes: List[int], seed: int, queries: int = 500, k: int = 10) -> None:
+    """Per-keystroke autocomplete latency: type real titles/authors one character at a time."""
+    print(f"{'n':>9} {'field':>7} {'keystrokes':>11} {'p50 us':>9} {'p99 us':>9} {'max us':>9} "
+          f"{'scan p50 us':>12}")
+    for n in sizes:
+        catalog = make_catalog(n, seed)
+        library, build_time = time_call(lambda: build_library(catalog))
+        for field in ("title", "author"):
+            library.autocomplete("", field=field)  # merge the bulk-loaded keys before timing
+        rng = random.Random(seed)
+        for field, column in (("title", 0), ("author", 1)):
+            latencies = []
+            for title_author in rng.sample(catalog, min(queries, n)):
+                text = title_author[column]
+                for end in range(1, min(len(text), 20) + 1):
+                    prefix = text[:end]
+                    start = time.perf_counter_ns()
+                    library.autocomplete(prefix, k, field=field)
+                    latencies.append((time.perf_counter_ns() - start) / 1000)
+            latencies.sort()
+
+            # Baseline: what a keystroke costs when it rescans the catalog like linear_search.
+            scans = []
+            for title_author in rng.sample(catalog, 5):
+                prefix = title_author[column][:3].lower()
+                start = time.perf_counter_ns()
+                [b for b in library.books if getattr(b, field).lower().startswith(prefix)][:k]
+                scans.append((time.perf_counter_ns() - start) / 1000)
+            scans.sort()
+            print(f"{n:>9} {field:>7} {len(latencies):>11} {percentile(latencies, 50):>9.1f} "
+                  f"{percentile(latencies, 99):>9.1f} {latencies[-1]:>9.1f} {percentile(scans, 50):>12.0f}")
+        print(f"{'':>9} (catalog build {build_time:.1f}s)")
+
+
+def bench_catalog(sizes: List[int], seed: int, queries: int = 200) -> None:
+    """Cold start from CSV (add_book per row + sort) versus opening a saved catalog with mmap."""
+    print(f"{'n':>9} {'csv load s':>11} {'save s':>8} {'file MB':>8} {'open ms':>8} "
+          f"{'query ms (memory)':>18} {'query ms (mapped)':>18} {'same':>5}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            catalog = make_catalog(n, seed)
+            csv_path = os.path.join(tmp, f"books_{n}.csv")
+            cat_path = os.path.join(tmp, f"books_{n}.cat")
+            with open(csv_path, "w", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file)
+                writer.writerow(["title", "author"])
+                writer.writerows(catalog)
+
+            def cold_start():
+                library = LibraryManager()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    library.load_from_csv(csv_path)
+                library.sort_books_by_author()
+                return library
+
+            library, load_time = time_call(cold_start)
+            with contextlib.redirect_stdout(io.StringIO()):
+                _, save_time = time_call(lambda: library.save_catalog(cat_path))
+            mapped, open_time = time_call(lambda: LibraryManager.open_catalog(cat_path))
+
+            # Selective queries: an author's last name or the rarest word of a title.
+            rng = random.Random(seed)
+            word_counts = collections.Counter(word for title, _ in catalog for word in title.split())
+            keywords = [rng.choice([min(title.split(), key=word_counts.__getitem__), author.split()[-1]])
+                        for title, author in rng.sample(catalog, min(queries, n))]
+            same = True
+            memory_time = mapped_time = 0.0
+            for keyword in keywords:
+                expected, elapsed = time_call(lambda: library.binary_search(keyword)[0] + library.hash_search(keyword)[0])
+                memory_time += elapsed
+                got, elapsed = time_call(lambda: mapped.binary_search(keyword)[0] + mapped.hash_search(keyword)[0])
+                mapped_time += elapsed
+                same = same and [str(b) for b in expected] == [str(b) for b in got]
+            print(f"{n:>9} {load_time:>11.2f} {save_time:>8.2f} {os.path.getsize(cat_path) / 1e6:>8.1f} "
+                  f"{open_time * 1000:>8.2f} {memory_time / len(keywords) * 1000:>18.3f} "
+                  f"{mapped_time / len(keywords) * 1000:>18.3f} {str(same):>5}")
+            del mapped
+
+
+def bench_ranked(sizes: List[int], seed: int, k: int = 10) -> None:
+    """Materialize-everything hash_search versus BM25 top-k on broad and narrow queries.
+
+    Each top-k query runs twice: the first call also computes the terms' score bounds, which
+    later calls reuse until the next add_book.
+    """
+    print(f"{'n':>9} {'query':>16} {'hits':>9} {'hash_search ms':>15} {'top-k ms (1st)':>15} {'top-k ms':>9}")
+    for n in sizes:
+        library = LibraryManager()
+        with contextlib.redirect_stdout(io.StringIO()):
+            library.create_performance_test(n)
+        for keyword in ("Book", "Mystery", "Smith", "Mystery Smith"):
+            (hits, _), hash_time = time_call(lambda: library.hash_search(keyword))
+            _, first_time = time_call(lambda: library.ranked_search(keyword, k))
+            _, cached_time = time_call(lambda: library.ranked_search(keyword, k))
+            print(f"{n:>9} {keyword:>16} {len(hits):>9} {hash_time * 1000:>15.2f} {first_time * 1000:>15.2f} "
+                  f"{cached_time * 1000:>9.2f}")
+
+
+def bench_memory(sizes: List[int], seed: int, queries: int = 15) -> None:
+    """Bytes per book and linear-scan time: original dict-backed books, slotted Books (with and
+    without interned authors), and the column-based BookTable LibraryManager stores (interned
+    authors, lowercase forms kept once).
+
+    The interned row separates the two effects: interning only pays once authors repeat (each
+    distinct author costs an entry in the intern table), and the table's columns cost slightly
+    more per book than a slotted Book, since they keep the lowercase forms; their win is the
+    scan, not the footprint.
+
+    Strings are decoded inside the measured region, as a CSV load would create them, so the
+    per-book figure includes titles, authors and the lowered copies. Keywords are whole title
+    words or author names; times are medians per keyword, and "match" excludes building Book
+    objects for the hits, which only the table layout has to do.
+    """
+    print(f"{'n':>9} {'layout':>22} {'bytes/book':>11} {'total MB':>9} {'match ms':>9} {'scan ms':>9} "
+          f"{'med hits':>9} {'same':>5}")
+    for n in sizes:
+        rows = [(title.encode(), author.encode()) for title, author in make_catalog(n, seed)]
+        rng = random.Random(seed)
+        keywords = [rng.choice(rng.choice(rows)[rng.randrange(2)].decode().split()) for _ in range(queries)]
+        results = {}
+        for name, build, search, match in (
+            ("dict Book + .lower()", lambda: [LegacyBook(t.decode(), a.decode()) for t, a in rows],
+             legacy_linear_search, legacy_linear_search),
+            ("slotted Book list", lambda: [Book(t.decode(), a.decode()) for t, a in rows],
+             legacy_linear_search, legacy_linear_search),
+            ("slotted, interned", lambda: [Book(t.decode(), sys.intern(a.decode())) for t, a in rows],
+             legacy_linear_search, legacy_linear_search),
+            ("BookTable (parallel)", lambda: build_table(rows), table_linear_search,
+             lambda books, keyword: books.ids_containing(keyword.lower())),
+        ):
+            def measure():
+                tracemalloc.start()
+                books = build()
+                allocated, _ = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                match_times = sorted(time_call(lambda: match(books, keyword))[1] for keyword in keywords)
+                timed = [time_call(lambda: search(books, keyword)) for keyword in keywords]
+                scan_times = sorted(elapsed for _, elapsed in timed)
+                return allocated, match_times, scan_times, [[book.title + book.author for book in found]
+                                                            for found, _ in timed]
+
+            # A fresh process per layout: the intern table only grows, so a layout measured after
+            # another that interned the same authors would not pay for its entries.
+            (allocated, match_times, scan_times, results[name]), _, _, _ = run_isolated(measure)
+            same = results[name] == next(iter(results.values()))
+            print(f"{n:>9} {name:>22} {allocated / n:>11.0f} {allocated / 1e6:>9.1f} "
+                  f"{percentile(match_times, 50) * 1000:>9.1f} {percentile(scan_times, 50) * 1000:>9.1f} "
+                  f"{percentile(sorted(map(len, results[name])), 50):>9} {str(same):>5}")
+
+
+def bench_cache(sizes: List[int], seed: int, distinct: int = 300, queries: int = 3000,
+                add_every: int = 500, capacity: int = 256, uncached_queries: int = 100) -> None:
+    """Repeated-query workload through search_books: no cache, the LRU query cache, and the
+    cache with only the fastest backend.
+
+    Queries are drawn Zipf-style from a few hundred keywords (title words and author names),
+    and a book is added every add_every queries, which invalidates everything cached so far.
+    The uncached baseline only runs the first uncached_queries of the stream. "same" checks
+    cached answers against an uncached run of the same backend.
+    """
+    print(f"{'n':>9} {'mode':>18} {'queries/s':>10} {'mean ms':>8} {'hit ratio':>10} {'evictions':>10} "
+          f"{'invalid.':>9} {'same':>5}")
+    for n in sizes:
+        catalog = make_catalog(n, seed)
+        keywords, stream = make_query_stream(catalog, random.Random(seed), distinct, queries)
+        extra = make_catalog(queries // add_every + 1, seed + 1)
+        for mode, fastest_only, use_cache in (("no cache", False, False), ("LRU cache", False, True),
+                                             ("LRU cache, fastest", True, True)):
+            library = build_library(catalog)
+            library.query_cache = type(library.query_cache)(capacity)
+            library.sort_books_by_author()
+            library.search_books(keywords[0], use_cache=False)  # time every backend once
+            same = True
+            start = time.perf_counter()
+            run = stream if use_cache else stream[:uncached_queries]
+            for i, keyword in enumerate(run):
+                if i and i % add_every == 0:
+                    library.add_book(*extra[i // add_every])
+                results = library.search_books(keyword, fastest_only, use_cache)
+                if use_cache and i % 50 == 0:
+                    expected = library.search_backends()
+                    same = same and all([str(b) for b in books] == [str(library.books[j]) for j in expected[name](keyword)]
+                                        for name, (books, _) in results.items())
+            elapsed = time.perf_counter() - start
+            cache = library.query_cache
+            print(f"{n:>9} {mode:>18} {len(run) / elapsed:>10.0f} {elapsed / len(run) * 1000:>8.3f} "
+                  f"{cache.hit_ratio:>10.1%} {cache.evictions:>10} {cache.invalidations:>9} {str(same):>5}")
+            del library
+
+
+def bench_fuzzy(sizes: List[int], seed: int, queries: int = 300, scans: int = 5) -> None:
+    """Typo lookups in the symmetric-delete index against an edit-distance scan of the vocabulary.
+
+    Here the sizes are distinct tokens. Queries are vocabulary tokens with one or two random
+    edits; "found" is how often the original token comes back at the distance the query
+    allows, and "same" compares the index with the scan on the first few queries.
+    """
+    print(f"{'tokens':>9} {'build s':>8} {'index MB':>9} {'k':>2} {'p50 us':>8} {'p99 us':>8} "
+          f"{'matches':>8} {'found':>7} {'scan ms':>9} {'same':>5}")
+    for n in sizes:
+        rng = random.Random(seed)
+        vocab = list(dict.fromkeys(make_token(rng) for _ in range(int(n * 1.2))))[:n]
+        index, build_time = time_call(lambda: DeleteIndex(vocab))
+        _, index_time = time_call(lambda: index.lookup(vocab[0]))  # the first lookup indexes the vocabulary
+        build_time += index_time
+        size = sys.getsizeof(index.deletes) + sum(sys.getsizeof(key) for key in index.deletes)
+        size += sum(sys.getsizeof(ids) for ids in index.deletes.values() if type(ids) is not int)
+        for k in (1, 2):
+            originals = rng.sample(vocab, queries)
+            typos = [make_typo(rng, word, rng.randint(1, k)) for word in originals]
+            latencies, matches, found = [], 0, 0
+            for original, typo in zip(originals, typos):
+                start = time.perf_counter_ns()
+                near = index.lookup(typo, k)
+                latencies.append((time.perf_counter_ns() - start) / 1000)
+                matches += len(near)
+                found += original in {token for token, _ in near}
+            latencies.sort()
+            same = True
+            scan_time = 0.0
+            for typo in typos[:scans]:
+                expected, elapsed = time_call(lambda: sorted(
+                    ((token, d) for token, d in ((token, edit_distance(typo, token, k)) for token in vocab) if d <= k),
+                    key=lambda match: (match[1], match[0])))
+                scan_time += elapsed
+                same = same and expected == index.lookup(typo, k)
+            print(f"{n:>9} {build_time:>8.1f} {size / 1e6:>9.0f} {k:>2} {percentile(latencies, 50):>8.0f} "
+                  f"{percentile(latencies, 99):>8.0f} {matches / queries:>8.1f} {found / queries:>7.1%} "
+                  f"{scan_time / scans * 1000:>9.0f} {str(same):>5}")
+        del index
+
+
+def bench_batch(sizes: List[int], seed: int, distinct: int = 2000, queries: int = 5000, limit: int = 20) -> None:
+    """Query throughput for a service: hash_search one keyword at a time, search_batch, and the
+    AsyncLibrary facade on a worker thread and on worker processes over a saved catalog.
+
+    The stream repeats keywords Zipf-style, as real traffic does. Batch and async rows build
+    at most limit books per result, as a service page would; the no-limit batch row is the
+    like-for-like comparison with hash_search. The query cache is emptied before every row.
+    """
+    print(f"{'n':>9} {'mode':>28} {'queries/s':>10} {'total ms':>9} {'same':>5}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            catalog = make_catalog(n, seed)
+            _, stream = make_query_stream(catalog, random.Random(seed), distinct, queries)
+            library = build_library(catalog)
+            library.sort_books_by_author()
+            cat_path = os.path.join(tmp, f"books_{n}.cat")
+            with contextlib.redirect_stdout(io.StringIO()):
+                library.save_catalog(cat_path)
+            expected, elapsed = time_call(lambda: [len(library.hash_search(keyword)[0]) for keyword in stream])
+
+            def report(mode, results, elapsed):
+                same = [result.total for result in results] == expected
+                print(f"{n:>9} {mode:>28} {len(stream) / elapsed:>10.0f} {elapsed * 1000:>9.0f} {str(same):>5}")
+
+            print(f"{n:>9} {'hash_search per keyword':>28} {len(stream) / elapsed:>10.0f} {elapsed * 1000:>9.0f} "
+                  f"{'True':>5}")
+            library.query_cache.clear()
+            report("search_batch, no limit", *time_call(lambda: library.search_batch(stream)))
+            library.query_cache.clear()
+            report(f"search_batch, limit {limit}", *time_call(lambda: library.search_batch(stream, limit=limit)))
+
+            async def serve(source, workers=None):
+                async with AsyncLibrary(source, workers) as service:
+                    await service.search("warm up")  # start the workers outside the timing
+                    return await asyncio.gather(*(service.search_many(stream[i:i + 500], limit=limit)
+                                                  for i in range(0, len(stream), 500)))
+
+            for mode, source, workers in (("AsyncLibrary, thread", library, None),
+                                          (f"AsyncLibrary, {os.cpu_count()} worker proc.", cat_path, None)):
+                library.query_cache.clear()
+                parts, elapsed = time_call(lambda: asyncio.run(serve(source, workers)))
+                report(mode, [result for part in parts for result in part], elapsed)
+
+
+def bench_scaling(sizes: List[int], seed: int) -> None:
+    """How the three search algorithms scale with catalog size, via the shared timing harness.
+
+    Every size searches for the same selective keyword (the longest author last name among
+    the first rows, which make_catalog generates identically for every n), with warmup and
+    repeated runs; the last row is the fitted exponent of time ~ n^k.
+    """
+    def setup(n):
+        catalog = make_catalog(n, seed)
+        library = build_library(catalog)
+        library.sort_books_by_author()
+        keyword = max((author.split()[-1] for _, author in catalog[:50]), key=len)
+        return {"Linear Search": lambda: library.linear_search(keyword),
+                "Binary Search": lambda: library.binary_search(keyword),
+                "Hash Search": lambda: library.hash_search(keyword)}
+
+    print(timing.format_sweep(timing.sweep(sizes, setup, repeat=5)))
+
+
+def run_isolated(fn: Callable, *args) -> Tuple[Any, float, float, float]:
+    """Run fn(*args) in a forked child so peak memory is its own.
+
+    Returns fn's result, seconds, and the child's peak RSS in MB along with the largest peak
+    among any worker processes it started (ru_maxrss cannot be reset within a process).
+    """
+    receiver, sender = multiprocessing.get_context("fork").Pipe(duplex=False)
+
+    def child():
+        start = time.perf_counter()
+        result = fn(*args)
+        elapsed = time.perf_counter() - start
+        sender.send((result, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+                     resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024))
+
+    process = multiprocessing.get_context("fork").Process(target=child)
+    process.start()
+    result = receiver.recv()
+    process.join()
+    return result
+
+
+def write_ingest_files(n: int, seed: int, directory: str, shards: int) -> Tuple[str, str, List[str]]:
+    """Stream an n-row catalog into one CSV, one JSON array and `shards` CSV shard files."""
+    csv_path, json_path = os.path.join(directory, "books.csv"), os.path.join(directory, "books.json")
+    shard_paths = [os.path.join(directory, f"books_{i}.csv") for i in range(shards)]
+    with contextlib.ExitStack() as stack:
+        files = [stack.enter_context(open(path, "w", newline="", encoding="utf-8")) for path in [csv_path] + shard_paths]
+        writers = [csv.writer(file) for file in files]
+        json_file = stack.enter_context(open(json_path, "w", encoding="utf-8"))
+        for writer in writers:
+            writer.writerow(["title", "author"])
+        json_file.write("[")
+        per_shard = -(-n // shards)
+        for i, (title, author) in enumerate(iter_catalog(n, seed)):
+            writers[0].writerow((title, author))
+            writers[1 + i // per_shard].writerow((title, author))
+            json_file.write(("," if i else "") + "\n  " + json.dumps({"title": title, "author": author}))
+        json_file.write("\n]\n")
+    return csv_path, json_path, shard_paths
+
+
+def catalog_fingerprint(library: LibraryManager) -> Tuple:
+    index = library.index
+    return (len(library.books), len(index), sum(map(len, index.postings.values())), index.total_title_length,
+            tuple(library.sorted_ids[:5]), tuple(library.sorted_ids[-5:]), str(library.books[len(library.books) - 1]))
+
+
+def legacy_load_csv(path: str) -> Tuple:
+    """The original load_from_csv (DictReader + add_book per row), then the author sort."""
+    library = LibraryManager()
+    with open(path, "r", encoding="utf-8") as file:
+        for row in csv.DictReader(file):
+            library.add_book(row["title"], row["author"])
+    library.sort_books_by_author()
+    return catalog_fingerprint(library)
+
+
+def legacy_load_json(path: str) -> Tuple:
+    """The original load_from_json (json.load of the whole document + add_book per row), then the sort."""
+    library = LibraryManager()
+    with open(path, "r", encoding="utf-8") as file:
+        for book_data in json.load(file):
+            library.add_book(book_data["title"], book_data["author"])
+    library.sort_books_by_author()
+    return catalog_fingerprint(library)
+
+
+def bulk_load_file(path: str) -> Tuple:
+    library = LibraryManager()
+    library.bulk_load(iter_json_books(path) if path.endswith(".json") else iter_csv_books(path))
+    return catalog_fingerprint(library)
+
+
+def shard_load(paths: List[str]) -> Tuple:
+    library = LibraryManager()
+    library.load_shards(paths)
+    return catalog_fingerprint(library)
+
+
+def bench_ingest(sizes: List[int], seed: int, shards: int = 4, legacy_json_limit: int = 1_000_000) -> None:
+    """Catalog load time and peak memory: per-row add_book loaders against the streaming bulk loads.
+
+    Every mode runs in its own forked process and ends with a queryable, author-sorted catalog;
+    "peak MB" is that process's peak RSS above an idle fork's, and "workers MB" the largest
+    shard worker's. load_shards starts one worker per CPU (at most one per shard); with a single
+    CPU it streams the shards through bulk_load, so "workers MB" stays 0. The legacy JSON loader
+    holds the whole parsed document, so it only runs up to legacy_json_limit rows. "same" compares book, token and posting counts and the author order.
+    """
+    print(f"{'n':>9} {'mode':>28} {'load s':>8} {'rows/s':>9} {'peak MB':>8} {'workers MB':>11} {'same':>5}")
+    _, _, idle, _ = run_isolated(lambda: None)
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path, json_path, shard_paths = write_ingest_files(n, seed, tmp, shards)
+            modes = [("add_book per row (csv)", legacy_load_csv, csv_path)]
+            if n <= legacy_json_limit:
+                modes.append(("json.load + add_book", legacy_load_json, json_path))
+            modes += [("bulk_load, streamed csv", bulk_load_file, csv_path),
+                      ("bulk_load, streamed json", bulk_load_file, json_path),
+                      (f"load_shards, {shards} csv shards", shard_load, shard_paths)]
+            expected = None
+            for mode, load, source in modes:
+                fingerprint, elapsed, peak, workers = run_isolated(load, source)
+                expected = expected or fingerprint
+                print(f"{n:>9} {mode:>28} {elapsed:>8.1f} {n / elapsed:>9.0f} {peak - idle:>8.0f} "
+                      f"{workers:>11.0f} {str(fingerprint == expected):>5}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmarks for the library search structures in task2.")
+    parser.add_argument("--bench", choices=["autocomplete", "catalog", "ranked", "memory", "cache", "fuzzy", "batch", "scaling",
+                                            "ingest"],
+                        nargs="+",
+                        default=["autocomplete", "catalog", "ranked", "memory", "cache", "fuzzy", "batch", "scaling",
+                                 "ingest"],
+                        help="Benchmarks to run")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000], help="Catalog sizes to test")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    if "autocomplete" in args.bench:
+        bench_autocomplete(args.sizes, args.seed)
+    if "catalog" in args.bench:
+        bench_catalog(args.sizes, args.seed)
+    if "ranked" in args.bench:
+        bench_ranked(args.sizes, args.seed)
+    if "memory" in args.bench:
+        bench_memory(args.sizes, args.seed)
+    if "cache" in args.bench:
+        bench_cache(args.sizes, args.seed)
+    if "fuzzy" in args.bench:
+        bench_fuzzy(args.sizes, args.seed)
+    if "batch" in args.bench:
+        bench_batch(args.sizes, args.seed)
+    if "scaling" in args.bench:
+        bench_scaling(args.sizes, args.seed)
+    if "ingest" in args.bench:
+        bench_ingest(args.sizes, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,86 @@ import csv
 import math
 import os
 import random
-import matplotlib.pyplot as plt
-from dataclasses import dataclass
-from typing import Iterable, List, Optional, Sequence, Tuple
+import struct
+import time
+from collections import deque
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from multiprocessing import shared_memory
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 
 Point = Tuple[float, float]
 Route = List[int]
+DistanceMatrix = Union[Sequence[Sequence[float]], np.ndarray, "DistanceOracle"]
+
+
+def _parse_point_row(row: Sequence[str]) -> Optional[Point]:
+    try:
+        x = float(row[0]) if row[0] != "x" else None
+        y = float(row[1]) if row[1] != "y" else None
+        if x is None or y is None:
+            return None
+        return (x, y)
+    except Exception:
+        return None
+
+
+def load_points_array(
+    path: Optional[str] = None,
+    *,
+    num_points: int = 30,
+    seed: int = 42,
+    min_coord: float = 0.0,
+    max_coord: float = 100.0,
+    chunk_bytes: int = 1 << 24,
+) -> np.ndarray:
+    """Load sensor coordinates as a contiguous (n, 2) float64 array.
+
+    `.npy` files are memory-mapped rather than read. CSV files are parsed in chunks of about
+    `chunk_bytes` with NumPy's C parser, taking the first two columns; a chunk containing a
+    header or malformed rows falls back to the row-by-row rules of load_points for just that
+    chunk, so unparseable rows are skipped exactly as before; a CSV with no rows beyond the
+    header gives an empty (0, 2) array. Without a path (or if it does not exist) the same random
+    points as load_points are generated.
+    """
+    if not path or not os.path.exists(path):
+        return points_to_array(load_points(None, num_points=num_points, seed=seed, min_coord=min_coord, max_coord=max_coord))
+
+    if path.endswith(".npy"):
+        data = np.load(path, mmap_mode="r")
+        if data.ndim != 2 or data.shape[1] < 2:
+            raise ValueError(f"{path}: expected an (n, 2) array, got shape {data.shape}")
+        xy = data[:, :2]
+        return xy if xy.dtype == np.float64 and xy.flags.c_contiguous else np.ascontiguousarray(xy, dtype=np.float64)
+
+    chunks: List[np.ndarray] = []
+    with open(path, "r", newline="") as f:
+        first = True
+        while True:
+            lines = f.readlines(chunk_bytes)
+            if not lines:
+                break
+            if first:
+                # Header auto-detection: drop a leading row that does not parse as a point.
+                first = False
+                if _parse_point_row(next(csv.reader(lines[:1]), [""])) is None:
+                    lines = lines[1:]
+            if not any(line.strip() for line in lines):
+                continue  # nothing but a header or blank lines; np.loadtxt would warn on it
+            try:
+                block = np.loadtxt(lines, delimiter=",", usecols=(0, 1), ndmin=2, dtype=np.float64, comments=None)
+            except ValueError:
+                parsed = (_parse_point_row(row) for row in csv.reader(lines) if row)
+                block = np.array([p for p in parsed if p is not None], dtype=np.float64).reshape(-1, 2)
+            chunks.append(block)
+    if not chunks:
+        return np.empty((0, 2), dtype=np.float64)
+    return np.ascontiguousarray(np.concatenate(chunks))
 
 
 def load_points(
@@ -23,43 +96,18 @@ def load_points(
     """Load sensor coordinates from a CSV file or generate random points.
 
     Expected CSV format: header optional; two numeric columns named x,y or first two columns parsed as floats.
+    Large files are better read with load_points_array, which this delegates to for CSV input.
     """
-    rng = random.Random(seed)
-    points: List[Point] = []
-
     if csv_path and os.path.exists(csv_path):
-        with open(csv_path, "r", newline="") as f:
-            reader = csv.reader(f)
-            # Try to detect header
-            first_row = next(reader, None)
-            if first_row is None:
-                return points
-            def try_parse(row: Sequence[str]) -> Optional[Point]:
-                try:
-                    x = float(row[0]) if row[0] != "x" else None
-                    y = float(row[1]) if row[1] != "y" else None
-                    if x is None or y is None:
-                        return None
-                    return (x, y)
-                except Exception:
-                    return None
-
-            first_point = try_parse(first_row)
-            if first_point is not None:
-                points.append(first_point)
-            for row in reader:
-                if not row:
-                    continue
-                p = try_parse(row)
-                if p is not None:
-                    points.append(p)
-    else:
-        # Generate random points
-        for _ in range(num_points):
-            x = rng.uniform(min_coord, max_coord)
-            y = rng.uniform(min_coord, max_coord)
-            points.append((x, y))
+        return [(x, y) for x, y in load_points_array(csv_path).tolist()]
 
+    # Generate random points
+    rng = random.Random(seed)
+    points: List[Point] = []
+    for _ in range(num_points):
+        x = rng.uniform(min_coord, max_coord)
+        y = rng.uniform(min_coord, max_coord)
+        points.append((x, y))
     return points
 
 
@@ -69,18 +117,127 @@ def euclidean_distance(a: Point, b: Point) -> float:
     return math.hypot(dx, dy)
 
 
-def compute_distance_matrix(points: Sequence[Point]) -> List[List[float]]:
-    n = len(points)
-    dist: List[List[float]] = [[0.0] * n for _ in range(n)]
-    for i in range(n):
-        for j in range(i + 1, n):
-            d = euclidean_distance(points[i], points[j])
-            dist[i][j] = d
-            dist[j][i] = d
+def points_to_array(points: Sequence[Point]) -> np.ndarray:
+    """Pack points into a contiguous (n, 2) float64 array."""
+    return np.asarray(points, dtype=np.float64).reshape(-1, 2)
+
+
+def distance_matrix_array(
+    points: Union[Sequence[Point], np.ndarray],
+    *,
+    dtype: "np.typing.DTypeLike" = np.float64,
+    block_rows: int = 1024,
+) -> np.ndarray:
+    """Build the full Euclidean distance matrix as an ndarray using broadcasting.
+
+    Rows are filled in blocks so the temporaries stay at O(block_rows * n) rather than O(n^2).
+    Use dtype=np.float32 to halve memory on large instances.
+    """
+    xy = points_to_array(points)
+    n = len(xy)
+    x, y = xy[:, 0], xy[:, 1]
+    dist = np.empty((n, n), dtype=dtype)
+    for start in range(0, n, block_rows):
+        stop = min(start + block_rows, n)
+        np.hypot(x[start:stop, None] - x[None, :], y[start:stop, None] - y[None, :], out=dist[start:stop])
     return dist
 
 
-def route_length(route: Sequence[int], dist: Sequence[Sequence[float]], *, return_to_start: bool = True) -> float:
+def compute_distance_matrix(points: Sequence[Point]) -> List[List[float]]:
+    return distance_matrix_array(points).tolist()
+
+
+class DistanceOracle:
+    """Euclidean distances computed on demand from coordinates, for instances too large for an n x n matrix.
+
+    Answers the same lookups as a matrix (len(dist), dist[a] rows, dist.item(a, b)) in O(n) memory.
+    With cache_size > 0, recently used pairs are kept in a bounded LRU cache.
+    """
+
+    item: Callable[[int, int], float]
+
+    def __init__(self, points: Union[Sequence[Point], np.ndarray], *, cache_size: int = 0):
+        self.xy = points_to_array(points)
+        # array('d') indexing yields plain floats, which keeps scalar lookups in the SA loop cheap.
+        self.xs = array("d", self.xy[:, 0])
+        self.ys = array("d", self.xy[:, 1])
+        self.cache_size = cache_size
+        if cache_size > 0:
+            cached = lru_cache(maxsize=cache_size)(self._pair)
+            self.item = lambda a, b: cached(a, b) if a < b else cached(b, a)
+            self.cache_info = cached.cache_info
+        else:
+            self.item = self._pair
+
+    def _pair(self, a: int, b: int) -> float:
+        xs, ys = self.xs, self.ys
+        return math.hypot(xs[a] - xs[b], ys[a] - ys[b])
+
+    def __len__(self) -> int:
+        return len(self.xy)
+
+    def __getitem__(self, a: int) -> np.ndarray:
+        """Distances from sensor `a` to every sensor, computed as one row."""
+        x, y = self.xy[a]
+        return np.hypot(self.xy[:, 0] - x, self.xy[:, 1] - y)
+
+    def route_lengths(self, routes: Union[Sequence[Sequence[int]], np.ndarray], *, return_to_start: bool = True) -> np.ndarray:
+        r = np.atleast_2d(np.asarray(routes, dtype=np.intp))
+        stops = self.xy[r]
+        legs = np.diff(stops, axis=1)
+        totals = np.hypot(legs[..., 0], legs[..., 1]).sum(axis=1)
+        if return_to_start and r.shape[1]:
+            closing = stops[:, 0] - stops[:, -1]
+            totals += np.hypot(closing[:, 0], closing[:, 1])
+        return totals
+
+    def nbytes(self) -> int:
+        return self.xy.nbytes + self.xs.itemsize * (len(self.xs) + len(self.ys))
+
+    def extend(self, points: Union[Sequence[Point], np.ndarray]) -> range:
+        """Append sensors and return their new indices; existing indices (and cached pairs) stay valid."""
+        new_xy = points_to_array(points)
+        first = len(self.xy)
+        self.xy = np.concatenate([self.xy, new_xy])
+        self.xs.extend(new_xy[:, 0].tolist())
+        self.ys.extend(new_xy[:, 1].tolist())
+        return range(first, len(self.xy))
+
+
+def pair_distance_fn(dist: DistanceMatrix) -> Callable[[int, int], float]:
+    """Return a scalar lookup d(a, b) -> float that is fast for list-of-lists, ndarray and oracle distances."""
+    if isinstance(dist, (np.ndarray, DistanceOracle)):
+        return dist.item
+    rows = dist
+    return lambda a, b: rows[a][b]
+
+
+def route_lengths(
+    routes: Union[Sequence[Sequence[int]], np.ndarray],
+    dist: DistanceMatrix,
+    *,
+    return_to_start: bool = True,
+) -> np.ndarray:
+    """Vectorized tour lengths for a batch of equal-length routes, shape (m, n) -> (m,).
+
+    Only an ndarray or oracle is scored with array gathers; a list-of-lists matrix is walked
+    leg by leg rather than copied into an O(n^2) array on every call.
+    """
+    if isinstance(dist, DistanceOracle):
+        return dist.route_lengths(routes, return_to_start=return_to_start)
+    r = np.atleast_2d(np.asarray(routes, dtype=np.intp))
+    if not isinstance(dist, np.ndarray):
+        return np.array([route_length(route, dist, return_to_start=return_to_start) for route in r.tolist()],
+                        dtype=np.float64)
+    totals = dist[r[:, :-1], r[:, 1:]].sum(axis=1, dtype=np.float64)
+    if return_to_start and r.shape[1]:
+        totals += dist[r[:, -1], r[:, 0]]
+    return totals
+
+
+def route_length(route: Sequence[int], dist: DistanceMatrix, *, return_to_start: bool = True) -> float:
+    if isinstance(dist, (np.ndarray, DistanceOracle)):
+        return float(route_lengths([route], dist, return_to_start=return_to_start)[0])
     total = 0.0
     for i in range(len(route) - 1):
         total += dist[route[i]][route[i + 1]]
@@ -95,10 +252,28 @@ def random_route(n: int, rng: random.Random) -> Route:
     return r
 
 
-def greedy_nearest_neighbor(dist: Sequence[Sequence[float]], start: int = 0) -> Route:
+def greedy_nearest_neighbor(dist: DistanceMatrix, start: int = 0) -> Route:
     n = len(dist)
+    if isinstance(dist, DistanceOracle):
+        # Neighbor lists give the same nearest-unvisited choice without O(n) work per step.
+        return greedy_nearest_neighbor_knn(dist.xy, start=start)
+    if isinstance(dist, np.ndarray):
+        # One masked argmin per step; ties resolve to the lowest index.
+        visited = np.zeros(n, dtype=bool)
+        visited[start] = True
+        route: Route = [start]
+        current = start
+        row = np.empty(n, dtype=np.float64)
+        for _ in range(n - 1):
+            np.copyto(row, dist[current])
+            row[visited] = np.inf
+            current = int(row.argmin())
+            visited[current] = True
+            route.append(current)
+        return route
+
     unvisited = set(range(n))
-    route: Route = [start]
+    route = [start]
     unvisited.remove(start)
     current = start
     while unvisited:
@@ -109,51 +284,1009 @@ def greedy_nearest_neighbor(dist: Sequence[Sequence[float]], start: int = 0) ->
     return route
 
 
+def _kdtree(xy: np.ndarray):
+    """Return a scipy cKDTree over xy, or None when scipy is not installed."""
+    try:
+        from scipy.spatial import cKDTree
+    except ImportError:
+        return None
+    return cKDTree(xy)
+
+
+def build_neighbor_lists(points: Union[Sequence[Point], np.ndarray], k: int = 10, *, block_rows: int = 1024) -> np.ndarray:
+    """Return an (n, k) int array holding each sensor's k nearest other sensors, closest first.
+
+    Uses a KD-tree (scipy) in O(n log n); without scipy it falls back to a blocked brute-force scan.
+    """
+    xy = points_to_array(points)
+    n = len(xy)
+    k = max(0, min(k, n - 1))
+    if k == 0:
+        return np.empty((n, 0), dtype=np.int32)
+
+    tree = _kdtree(xy)
+    if tree is not None:
+        _, idx = tree.query(xy, k=k + 1)
+        # Drop each point's own index; with duplicate coordinates it is not always in column 0.
+        is_self = idx == np.arange(n)[:, None]
+        order = np.argsort(is_self, axis=1, kind="stable")[:, :k]
+        return np.take_along_axis(idx, order, axis=1).astype(np.int32)
+
+    neighbors = np.empty((n, k), dtype=np.int32)
+    x, y = xy[:, 0], xy[:, 1]
+    for start in range(0, n, block_rows):
+        stop = min(start + block_rows, n)
+        d2 = (x[start:stop, None] - x[None, :]) ** 2 + (y[start:stop, None] - y[None, :]) ** 2
+        d2[np.arange(stop - start), np.arange(start, stop)] = np.inf
+        part = np.argpartition(d2, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(d2, part, axis=1), axis=1)
+        neighbors[start:stop] = np.take_along_axis(part, order, axis=1)
+    return neighbors
+
+
+class _UnvisitedIndex:
+    """Nearest-unvisited queries for greedy construction once a sensor's neighbor list is exhausted.
+
+    The KD-tree is rebuilt over the remaining points whenever more than half of its points have
+    been visited, so the total rebuild cost stays O(n log n).
+    """
+
+    def __init__(self, xy: np.ndarray, visited: np.ndarray):
+        self.xy = xy
+        self.visited = visited
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        self.ids = np.flatnonzero(~self.visited)
+        self.tree = _kdtree(self.xy[self.ids]) if len(self.ids) else None
+        self.stale = 0
+
+    def mark_visited(self) -> None:
+        self.stale += 1
+        if self.stale * 2 > len(self.ids):
+            self._rebuild()
+
+    def nearest(self, point: np.ndarray) -> int:
+        """Index of the unvisited point closest to the coordinate `point`."""
+        if self.tree is None:
+            candidates = self.ids[~self.visited[self.ids]]
+            d2 = ((self.xy[candidates] - point) ** 2).sum(axis=1)
+            return int(candidates[d2.argmin()])
+        q = min(8, len(self.ids))
+        while True:
+            _, idx = self.tree.query(point, k=q)
+            hits = self.ids[np.atleast_1d(idx)]
+            unvisited = hits[~self.visited[hits]]
+            if len(unvisited):
+                return int(unvisited[0])
+            q = min(q * 2, len(self.ids))
+
+
+def greedy_nearest_neighbor_knn(
+    points: Union[Sequence[Point], np.ndarray],
+    neighbors: Optional[np.ndarray] = None,
+    *,
+    k: int = 10,
+    start: int = 0,
+) -> Route:
+    """Nearest-neighbor tour driven by precomputed neighbor lists instead of an O(n) scan per step.
+
+    Falls back to a KD-tree over the unvisited points only when every listed neighbor is taken.
+    Needs coordinates rather than a distance matrix, so it works on fields too large for one.
+    """
+    xy = points_to_array(points)
+    n = len(xy)
+    if n == 0:
+        return []
+    if neighbors is None:
+        neighbors = build_neighbor_lists(xy, k)
+    nbrs = neighbors.tolist()
+    visited = np.zeros(n, dtype=bool)
+    visited[start] = True
+    remaining = _UnvisitedIndex(xy, visited)
+    route: Route = [start]
+    current = start
+    for _ in range(n - 1):
+        next_city = -1
+        for c in nbrs[current]:
+            if not visited[c]:
+                next_city = c
+                break
+        if next_city < 0:
+            next_city = remaining.nearest(xy[current])
+        visited[next_city] = True
+        remaining.mark_visited()
+        route.append(next_city)
+        current = next_city
+    return route
+
+
+def _rotate_to(route: Route, start: int) -> Route:
+    p = route.index(start)
+    return route[p:] + route[:p]
+
+
+def hilbert_curve_route(points: Union[Sequence[Point], np.ndarray], *, order: int = 16, start: int = 0) -> Route:
+    """Visit sensors in Hilbert space-filling-curve order: O(n log n), fully vectorized.
+
+    Coordinates are snapped to a 2**order x 2**order grid; points close on the curve are close in
+    the plane, so this makes a near-instant starting tour for SA or local search.
+    """
+    xy = points_to_array(points)
+    if len(xy) == 0:
+        return []
+    side = 1 << order
+    lo = xy.min(axis=0)
+    span = float((xy.max(axis=0) - lo).max()) or 1.0
+    grid = np.minimum(((xy - lo) / span * side).astype(np.int64), side - 1)
+    x, y = grid[:, 0].copy(), grid[:, 1].copy()
+    index = np.zeros(len(xy), dtype=np.int64)
+    s = side >> 1
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        index += s * s * ((3 * rx.astype(np.int64)) ^ ry.astype(np.int64))
+        # Rotate the quadrant so the sub-curve has the canonical orientation.
+        flip = ~ry & rx
+        x[flip] = side - 1 - x[flip]
+        y[flip] = side - 1 - y[flip]
+        swap = ~ry
+        x[swap], y[swap] = y[swap], x[swap].copy()
+        s >>= 1
+    return _rotate_to(np.argsort(index, kind="stable").tolist(), start)
+
+
+def greedy_edge_route(
+    points: Union[Sequence[Point], np.ndarray],
+    neighbors: Optional[np.ndarray] = None,
+    *,
+    k: int = 10,
+    start: int = 0,
+) -> Route:
+    """Greedy-edge (Kruskal-like) tour: take candidate edges shortest first while degrees stay <= 2
+    and no cycle closes, then chain the resulting path fragments nearest-endpoint first.
+
+    Candidate edges come from the k-nearest-neighbor lists, so the whole build is O(n k log n).
+    """
+    xy = points_to_array(points)
+    n = len(xy)
+    if n <= 3:
+        return list(range(n))
+    if neighbors is None:
+        neighbors = build_neighbor_lists(xy, k)
+
+    # Unique undirected candidate edges, shortest first.
+    src = np.repeat(np.arange(n, dtype=np.int64), neighbors.shape[1])
+    dst = neighbors.ravel().astype(np.int64)
+    keys = np.unique(np.minimum(src, dst) * n + np.maximum(src, dst))
+    ea, eb = keys // n, keys % n
+    lengths = np.hypot(xy[ea, 0] - xy[eb, 0], xy[ea, 1] - xy[eb, 1])
+    order = np.argsort(lengths, kind="stable")
+
+    parent = list(range(n))
+
+    def find(c: int) -> int:
+        while parent[c] != c:
+            parent[c] = parent[parent[c]]
+            c = parent[c]
+        return c
+
+    adj: List[List[int]] = [[] for _ in range(n)]
+    accepted = 0
+    for a, b in zip(ea[order].tolist(), eb[order].tolist()):
+        if len(adj[a]) == 2 or len(adj[b]) == 2:
+            continue
+        ra, rb = find(a), find(b)
+        if ra == rb:
+            continue
+        parent[ra] = rb
+        adj[a].append(b)
+        adj[b].append(a)
+        accepted += 1
+        if accepted == n - 1:
+            break
+
+    # Walk each path fragment from one endpoint to the other.
+    endpoints = [c for c in range(n) if len(adj[c]) < 2]
+    other_end: Dict[int, int] = {}
+    paths: Dict[int, List[int]] = {}
+    for e in endpoints:
+        if e in other_end:
+            continue
+        path = [e]
+        prev, cur = -1, e
+        while True:
+            nxt = [c for c in adj[cur] if c != prev]
+            if not nxt:
+                break
+            prev, cur = cur, nxt[0]
+            path.append(cur)
+        other_end[e], other_end[cur] = cur, e
+        paths[e] = path
+        paths[cur] = path[::-1]
+
+    # Chain fragments: from the current tail, jump to the nearest endpoint of an unused fragment.
+    end_ids = np.asarray(endpoints, dtype=np.int64)
+    slot = {c: i for i, c in enumerate(endpoints)}
+    used = np.zeros(len(endpoints), dtype=bool)
+    remaining = _UnvisitedIndex(xy[end_ids], used)
+    route: Route = []
+    e = endpoints[0]
+    while True:
+        route.extend(paths[e])
+        for c in {e, other_end[e]}:
+            used[slot[c]] = True
+            remaining.mark_visited()
+        if used.all():
+            break
+        e = int(end_ids[remaining.nearest(xy[route[-1]])])
+    return _rotate_to(route, start)
+
+
 def two_opt_swap(route: Route, i: int, k: int) -> Route:
     # Returns a new route where the segment [i:k] is reversed
     return route[:i] + list(reversed(route[i : k + 1])) + route[k + 1 :]
 
 
+def two_opt_delta(route: Sequence[int], d: Callable[[int, int], float], i: int, k: int) -> float:
+    """Change in tour length from reversing route[i:k+1], using only the four edges it touches.
+
+    `d` is a scalar lookup from pair_distance_fn. Requires 1 <= i < k < len(route) - 1 so both
+    boundary edges are interior to the list.
+    """
+    a, b = route[i - 1], route[i]
+    c, e = route[k], route[k + 1]
+    return d(a, c) + d(b, e) - d(a, b) - d(c, e)
+
+
+@dataclass
+class AnnealState:
+    """Everything needed to continue an SA run exactly: schedule, RNG and both routes.
+
+    `best` is None while the current route is the best seen so far.
+    """
+
+    current: Route
+    current_cost: float
+    best: Optional[Route]
+    best_cost: float
+    temp: float
+    cooling_rate: float
+    iteration: int
+    iterations: int
+    rng: random.Random
+
+    @classmethod
+    def start(
+        cls,
+        initial_route: Route,
+        dist: DistanceMatrix,
+        *,
+        initial_temp: float = 100.0,
+        cooling_rate: float = 0.995,
+        iterations: int = 50000,
+        seed: int = 42,
+    ) -> "AnnealState":
+        current = list(initial_route)
+        cost = route_length(current, dist)
+        return cls(current, cost, None, cost, initial_temp, cooling_rate, 0, iterations, random.Random(seed))
+
+    @property
+    def best_route(self) -> Route:
+        return self.current if self.best is None else self.best
+
+
+# Checkpoint layout (little-endian): header, 625 uint32 Mersenne Twister words, the current
+# route as int32, then the best route as int32 when it differs from the current one.
+_CHECKPOINT_MAGIC = b"SACK"
+_CHECKPOINT_VERSION = 1
+_CHECKPOINT_HEADER = struct.Struct("<4sHHqqqddddd??")
+
+
+def save_checkpoint(path: str, state: AnnealState) -> None:
+    """Write `state` to a compact binary file, atomically replacing any previous checkpoint."""
+    rng_version, internal, gauss_next = state.rng.getstate()
+    header = _CHECKPOINT_HEADER.pack(
+        _CHECKPOINT_MAGIC,
+        _CHECKPOINT_VERSION,
+        rng_version,
+        len(state.current),
+        state.iteration,
+        state.iterations,
+        state.temp,
+        state.cooling_rate,
+        state.current_cost,
+        state.best_cost,
+        0.0 if gauss_next is None else gauss_next,
+        gauss_next is not None,
+        state.best is not None,
+    )
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(np.asarray(internal, dtype="<u4").tobytes())
+        f.write(np.asarray(state.current, dtype="<i4").tobytes())
+        if state.best is not None:
+            f.write(np.asarray(state.best, dtype="<i4").tobytes())
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str) -> AnnealState:
+    with open(path, "rb") as f:
+        data = f.read()
+    (magic, version, rng_version, n, iteration, iterations, temp, cooling_rate,
+     current_cost, best_cost, gauss, has_gauss, has_best) = _CHECKPOINT_HEADER.unpack_from(data)
+    if magic != _CHECKPOINT_MAGIC or version != _CHECKPOINT_VERSION:
+        raise ValueError(f"{path} is not a version {_CHECKPOINT_VERSION} SA checkpoint")
+    offset = _CHECKPOINT_HEADER.size
+    internal = np.frombuffer(data, dtype="<u4", count=625, offset=offset)
+    offset += internal.nbytes
+    current = np.frombuffer(data, dtype="<i4", count=n, offset=offset).tolist()
+    offset += 4 * n
+    best = np.frombuffer(data, dtype="<i4", count=n, offset=offset).tolist() if has_best else None
+    rng = random.Random()
+    rng.setstate((rng_version, tuple(internal.tolist()), gauss if has_gauss else None))
+    return AnnealState(current, current_cost, best, best_cost, temp, cooling_rate, iteration, iterations, rng)
+
+
+def anneal(
+    state: AnnealState,
+    dist: DistanceMatrix,
+    *,
+    neighbors: Optional[np.ndarray] = None,
+    report_every: int = 10000,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_every: Optional[int] = None,
+) -> Iterator[Tuple[int, float, float]]:
+    """Advance `state` to state.iterations, yielding (iteration, temp, best_cost) every
+    `report_every` iterations and at the end.
+
+    `state` is consistent at every yield, so callers can read state.best_route or call
+    save_checkpoint there. With `checkpoint_path` a checkpoint is also written every
+    `checkpoint_every` iterations (default: report_every) and at the end, whether or not
+    that falls on a report. Resuming from a checkpoint replays the exact same moves.
+    """
+    rng = state.rng
+    d = pair_distance_fn(dist)
+    current = state.current
+    current_cost, best_cost = state.current_cost, state.best_cost
+    # The best route is only copied out when we are about to move away from it,
+    # so accepted improvements cost O(segment) instead of O(n).
+    best, at_best = state.best, state.best is None
+    temp, cooling_rate = state.temp, state.cooling_rate
+
+    n = len(current)
+    if n < 4:
+        return
+
+    nbrs = neighbors.tolist() if neighbors is not None else None
+    pos = [0] * n
+    for idx, city in enumerate(current):
+        pos[city] = idx
+
+    report_every = max(1, report_every)
+    checkpoint_every = max(1, checkpoint_every or report_every)
+    next_report = state.iteration + report_every
+    next_checkpoint = state.iteration + checkpoint_every if checkpoint_path else state.iterations
+    while state.iteration < state.iterations:
+        # Run up to the next report or checkpoint, whichever comes first.
+        chunk = min(next_report, next_checkpoint, state.iterations) - state.iteration
+        for _ in range(chunk):
+            # Propose a 2-opt neighbor
+            if nbrs is None:
+                i = rng.randrange(1, n - 2)
+                k = rng.randrange(i + 1, n - 1)
+            else:
+                a = rng.randrange(n)
+                row = nbrs[a]
+                lo, hi = pos[a], pos[row[rng.randrange(len(row))]]
+                if lo > hi:
+                    lo, hi = hi, lo
+                i, k = lo + 1, hi
+                if k <= i or k > n - 2:
+                    # Already adjacent, or the move would cut the fixed closing edge.
+                    temp = max(temp * cooling_rate, 1e-6)
+                    continue
+            delta = two_opt_delta(current, d, i, k)
+
+            if delta < 0 or rng.random() < math.exp(-delta / max(1e-12, temp)):
+                candidate_cost = current_cost + delta
+                if candidate_cost < best_cost:
+                    best_cost = candidate_cost
+                    at_best = True
+                elif at_best:
+                    best = list(current)
+                    at_best = False
+                current[i : k + 1] = current[i : k + 1][::-1]
+                current_cost = candidate_cost
+                if nbrs is not None:
+                    for idx in range(i, k + 1):
+                        pos[current[idx]] = idx
+            temp *= cooling_rate
+            if temp < 1e-6:
+                temp = 1e-6
+
+        state.iteration += chunk
+        state.current_cost, state.best_cost, state.temp = current_cost, best_cost, temp
+        state.best = None if at_best else best
+        if checkpoint_path and (state.iteration >= next_checkpoint or state.iteration == state.iterations):
+            save_checkpoint(checkpoint_path, state)
+            next_checkpoint = state.iteration + checkpoint_every
+        if state.iteration >= next_report or state.iteration == state.iterations:
+            next_report = state.iteration + report_every
+            yield state.iteration, temp, best_cost
+
+
 def simulated_annealing(
     initial_route: Route,
-    dist: Sequence[Sequence[float]],
+    dist: DistanceMatrix,
     *,
     initial_temp: float = 100.0,
     cooling_rate: float = 0.995,
     iterations: int = 50000,
     seed: int = 42,
+    neighbors: Optional[np.ndarray] = None,
 ) -> Route:
-    rng = random.Random(seed)
-    current = list(initial_route)
-    best = list(current)
-    current_cost = route_length(current, dist)
-    best_cost = current_cost
-    temp = initial_temp
+    """Anneal a tour with 2-opt moves.
+
+    By default both cut points are drawn uniformly. When `neighbors` (from build_neighbor_lists)
+    is given, a proposal instead picks a sensor and one of its near neighbors and tries to make
+    them adjacent, which finds improving moves far more often on large fields. See anneal()
+    for the progress-reporting, checkpointable form of the same loop.
+    """
+    state = AnnealState.start(
+        initial_route, dist, initial_temp=initial_temp, cooling_rate=cooling_rate, iterations=iterations, seed=seed
+    )
+    for _ in anneal(state, dist, neighbors=neighbors, report_every=max(1, iterations)):
+        pass
+    return state.best_route
+
+
+class _ArrayTour:
+    """Tour stored as a city array plus inverse positions, with orientation-free 2-opt moves."""
+
+    def __init__(self, route: Sequence[int], size: Optional[int] = None):
+        """`size` bounds the city ids when the route visits only some of them."""
+        self.route = list(route)
+        self.n = len(self.route)
+        pos = np.zeros(self.n if size is None else size, dtype=np.int64)
+        pos[self.route] = np.arange(self.n)
+        self.pos = pos.tolist()
+
+    def succ(self, city: int) -> int:
+        p = self.pos[city] + 1
+        return self.route[p if p < self.n else 0]
+
+    def pred(self, city: int) -> int:
+        return self.route[self.pos[city] - 1]
+
+    def reverse_path(self, x: int, y: int) -> None:
+        """Reverse the forward path x..y, physically flipping whichever side of the cycle is shorter."""
+        route, pos, n = self.route, self.pos, self.n
+        i, j = pos[x], pos[y]
+        length = (j - i) % n + 1
+        if 2 * length > n:
+            i, j = pos[self.succ(y)], pos[self.pred(x)]
+            length = n - length
+        for _ in range(length // 2):
+            ci, cj = route[i], route[j]
+            route[i], pos[cj] = cj, i
+            route[j], pos[ci] = ci, j
+            i = i + 1 if i + 1 < n else 0
+            j = j - 1 if j > 0 else n - 1
+
+    def move(self, a: int, b: int, c: int, d: int) -> None:
+        """Replace edges {a,b},{c,d} with {a,c},{b,d}; b, d must both follow (or both precede) a, c."""
+        if self.succ(a) == b:
+            self.reverse_path(b, c)
+        else:
+            self.reverse_path(a, d)
+
+    def rotated(self, start: int) -> Route:
+        p = self.pos[start]
+        return self.route[p:] + self.route[:p]
+
+
+def local_search(
+    route: Route,
+    dist: DistanceMatrix,
+    neighbors: Union[np.ndarray, List[List[int]]],
+    *,
+    max_segment: int = 3,
+    eps: float = 1e-9,
+    active: Optional[Iterable[int]] = None,
+    max_moves: Optional[int] = None,
+) -> Route:
+    """Deterministic 2-opt + Or-opt descent driven by neighbor lists and don't-look bits.
+
+    Each city in the work queue is tried as an endpoint of an improving 2-opt move or of a
+    relocated segment of up to `max_segment` cities (inserted in either orientation). Cities
+    are only re-queued when one of their tour edges changes, so once the tour is nearly locally
+    optimal a pass costs roughly O(n * k). Returns the route rotated to start at route[0].
+
+    `active` limits the initial queue (default: every city) and `max_moves` caps the number of
+    improving moves, which together give a bounded repair around a local change. Neighbor lists
+    may be given as Python lists indexed by city id, in which case the route may skip ids.
+    """
+    n = len(route)
+    if n < 5:
+        return list(route)
+    d = pair_distance_fn(dist)
+    nbrs = neighbors.tolist() if isinstance(neighbors, np.ndarray) else neighbors
+    tour = _ArrayTour(route, size=len(nbrs))
+    succ, pred = tour.succ, tour.pred
+    queue = deque(route if active is None else active)
+    queued = [False] * len(nbrs)
+    for c in queue:
+        queued[c] = True
+
+    def wake(*cities: int) -> None:
+        for c in cities:
+            if not queued[c]:
+                queued[c] = True
+                queue.append(c)
+
+    def try_two_opt(a: int) -> bool:
+        for step in (succ, pred):
+            an = step(a)
+            d_a_an = d(a, an)
+            for c in nbrs[a]:
+                g1 = d_a_an - d(a, c)
+                if g1 <= eps:
+                    break
+                cn = step(c)
+                if c == an or cn == a:
+                    continue
+                if d(an, cn) - d(c, cn) - g1 < -eps:
+                    tour.move(a, an, c, cn)
+                    wake(a, an, c, cn)
+                    return True
+        return False
+
+    def try_or_opt(a: int) -> bool:
+        for length in range(1, max_segment + 1):
+            if length + 4 > n:
+                break
+            for a_is_s1 in (True, False) if length > 1 else (True,):
+                # Forward segment s1..s2 with `a` at one end.
+                s1 = s2 = a
+                segment = {a}
+                for _ in range(length - 1):
+                    if a_is_s1:
+                        s2 = succ(s2)
+                        segment.add(s2)
+                    else:
+                        s1 = pred(s1)
+                        segment.add(s1)
+                p, nx = pred(s1), succ(s2)
+                removal_gain = d(p, s1) + d(s2, nx) - d(p, nx)
+                if removal_gain <= eps:
+                    continue
+                for end in (s1,) if s1 == s2 else (s1, s2):
+                    for c in nbrs[end]:
+                        if d(end, c) >= removal_gain:
+                            break
+                        if c in segment:
+                            continue
+                        # Insert next to c, on either side of it.
+                        for cn in (succ(c), pred(c)):
+                            if cn in segment:
+                                continue
+                            u, v = (c, cn) if succ(c) == cn else (cn, c)
+                            if u == nx or v == p:
+                                continue
+                            # Forward insertion gives u s1..s2 v, reversed gives u s2..s1 v.
+                            reverse = s1 == s2 or (end == s1) != (u == c)
+                            if reverse:
+                                add = d(u, s2) + d(s1, v)
+                            else:
+                                add = d(u, s1) + d(s2, v)
+                            if add - d(u, v) - removal_gain < -eps:
+                                tour.move(p, s1, u, v)
+                                tour.move(p, u, nx, s2)
+                                if not reverse:
+                                    tour.move(u, s2, s1, v)
+                                wake(p, nx, s1, s2, u, v)
+                                return True
+        return False
+
+    moves = 0
+    while queue:
+        a = queue.popleft()
+        queued[a] = False
+        if try_two_opt(a) or try_or_opt(a):
+            moves += 1
+            if max_moves is not None and moves >= max_moves:
+                break
+    return tour.rotated(route[0])
+
+
+class IncrementalPlanner:
+    """Keeps a deployed route and its neighbor lists current as sensors are added or removed.
+
+    Sensor ids are stable: removed sensors are tombstoned and new ones get fresh ids, so only
+    the neighbor rows that actually change are recomputed. New sensors go in by cheapest
+    insertion next to their nearest routed neighbors, followed by a local_search repair seeded
+    with just the touched cities.
+    """
+
+    def __init__(
+        self,
+        points: Union[Sequence[Point], np.ndarray],
+        route: Optional[Route] = None,
+        *,
+        k: int = 10,
+        max_repair_moves: Optional[int] = 1000,
+        rebuild_fraction: float = 0.25,
+    ):
+        self.oracle = DistanceOracle(points)
+        n = len(self.oracle)
+        self.k = max(1, min(k, n - 1))
+        self.max_repair_moves = max_repair_moves
+        self.rebuild_fraction = rebuild_fraction
+        self.alive = np.ones(n, dtype=bool)
+        neighbors = build_neighbor_lists(self.oracle.xy, self.k)
+        self.rows: List[List[int]] = neighbors.tolist()
+        # Squared distance to each sensor's farthest listed neighbor: a change closer than this
+        # touches its row.
+        self.radius2 = np.full(n, np.inf)
+        if neighbors.shape[1]:
+            gap = self.oracle.xy[neighbors[:, -1]] - self.oracle.xy
+            self.radius2 = np.einsum("ij,ij->i", gap, gap)
+        self._rebuild_tree()
+        if route is None:
+            route = local_search(greedy_edge_route(self.oracle.xy, neighbors), self.oracle, self.rows)
+        self.route: Route = list(route)
+
+    @property
+    def length(self) -> float:
+        return route_length(self.route, self.oracle)
+
+    def _rebuild_tree(self) -> None:
+        self._tree_ids = np.flatnonzero(self.alive)
+        self._tree_size = len(self.alive)
+        self._tree = _kdtree(self.oracle.xy[self._tree_ids])
+        self._changes = 0
+
+    def _refresh_row(self, city: int) -> None:
+        """Recompute one neighbor row from the KD-tree snapshot plus a scan of sensors added since."""
+        xy, point = self.oracle.xy, self.oracle.xy[city]
+        if self._tree is not None:
+            found = np.empty(0, dtype=np.int64)
+            q = min(2 * self.k + 1, len(self._tree_ids))
+            while q:
+                _, idx = self._tree.query(point, k=q)
+                ids = self._tree_ids[np.atleast_1d(idx)]
+                found = ids[self.alive[ids] & (ids != city)]
+                if len(found) >= self.k or q == len(self._tree_ids):
+                    break
+                q = min(q * 2, len(self._tree_ids))
+            extra = np.arange(self._tree_size, len(self.alive))
+        else:
+            found = np.empty(0, dtype=np.int64)
+            extra = np.arange(len(self.alive))
+        extra = extra[self.alive[extra] & (extra != city)]
+        candidates = np.concatenate([found[: self.k], extra])
+        gap = xy[candidates] - point
+        d2 = np.einsum("ij,ij->i", gap, gap)
+        order = np.argsort(d2, kind="stable")[: self.k]
+        self.rows[city] = candidates[order].tolist()
+        self.radius2[city] = d2[order[-1]] if len(order) == self.k else np.inf
+
+    def _rows_within_reach(self, city: int) -> np.ndarray:
+        """Living sensors whose neighbor row could list `city` (distance within their radius)."""
+        gap = self.oracle.xy - self.oracle.xy[city]
+        hits = np.flatnonzero(self.alive & (np.einsum("ij,ij->i", gap, gap) <= self.radius2))
+        return hits[hits != city]
+
+    def apply_changes(
+        self,
+        inserted: Union[Sequence[Point], np.ndarray] = (),
+        deleted: Iterable[int] = (),
+    ) -> List[int]:
+        """Remove sensor ids in `deleted`, add the `inserted` coordinates, and repair the route.
+
+        Returns the ids assigned to the inserted sensors.
+        """
+        deleted = [c for c in dict.fromkeys(deleted) if self.alive[c]]
+        new_xy = points_to_array(inserted) if len(inserted) else np.empty((0, 2))
+        d = self.oracle.item
+        touched: List[int] = []
+        stale = set()
+
+        # Deletions: splice out of the route and refresh only the rows that listed them.
+        if deleted:
+            for c in deleted:
+                p = self.route.index(c)
+                touched.extend((self.route[p - 1], self.route[(p + 1) % len(self.route)]))
+                del self.route[p]
+            self.alive[deleted] = False
+            for c in deleted:
+                stale.update(self._rows_within_reach(c).tolist())
+                self.rows[c] = []
+                self.radius2[c] = np.inf
+
+        new_ids = list(self.oracle.extend(new_xy)) if len(new_xy) else []
+        if new_ids:
+            self.alive = np.concatenate([self.alive, np.ones(len(new_ids), dtype=bool)])
+            self.radius2 = np.concatenate([self.radius2, np.full(len(new_ids), np.inf)])
+            self.rows.extend([] for _ in new_ids)
+        self._changes += len(deleted) + len(new_ids)
+        if self._changes > self.rebuild_fraction * max(len(self.route), 1):
+            self._rebuild_tree()
+        for c in new_ids:
+            stale.update(self._rows_within_reach(c).tolist())
+            stale.add(c)
+        for c in stale:
+            self._refresh_row(c)
+
+        # Cheapest insertion, next to each new sensor's nearest already-routed neighbors.
+        if new_ids:
+            pos = np.full(len(self.alive), -1, dtype=np.int64)
+            pos[np.fromiter(self.route, dtype=np.int64, count=len(self.route))] = np.arange(len(self.route))
+            placements = []
+            for c in new_ids:
+                best = (math.inf, len(self.route))
+                for nb in self.rows[c]:
+                    i = int(pos[nb])
+                    if i < 0:
+                        continue
+                    for a, b, at in ((self.route[i - 1], nb, i), (nb, self.route[(i + 1) % len(self.route)], i + 1)):
+                        cost = d(a, c) + d(c, b) - d(a, b)
+                        if cost < best[0]:
+                            best = (cost, at)
+                placements.append((best[1], c))
+            for at, c in sorted(placements, reverse=True):
+                self.route.insert(at, c)
+            touched.extend(new_ids)
+
+        touched.extend(stale)
+        self.route = local_search(
+            self.route,
+            self.oracle,
+            self.rows,
+            active=[c for c in touched if self.alive[c]],
+            max_moves=self.max_repair_moves,
+        )
+        return new_ids
+
+
+@dataclass
+class ChainResult:
+    route: Route
+    cost: float
+    seed: int
+    iterations: int
+    seconds: float  # CPU time, so time-slicing on oversubscribed cores does not inflate it
+    worker: int
 
-    n = len(current)
-    if n < 4:
-        return current
 
+@dataclass
+class MultiStartResult:
+    best_route: Route
+    best_cost: float
+    chains: List[ChainResult] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    @property
+    def cpu_utilization(self) -> float:
+        """Total chain CPU time divided by wall-clock time: the parallelism achieved, not a speedup
+        over running the chains serially (pool start-up and IPC count as wall time)."""
+        busy = sum(c.seconds for c in self.chains)
+        return busy / self.wall_seconds if self.wall_seconds > 0 else 1.0
+
+    def worker_throughput(self) -> Dict[int, Tuple[int, float]]:
+        """Map worker pid -> (chains run, SA iterations per second)."""
+        stats: Dict[int, List[float]] = {}
+        for c in self.chains:
+            entry = stats.setdefault(c.worker, [0, 0, 0.0])
+            entry[0] += 1
+            entry[1] += c.iterations
+            entry[2] += c.seconds
+        return {pid: (int(n), it / secs if secs > 0 else float("inf")) for pid, (n, it, secs) in stats.items()}
+
+
+# Per-process state for SA workers, set once by _init_sa_worker so tasks only carry a seed.
+_worker_state: Dict[str, object] = {}
+
+
+def _init_sa_worker(
+    dist_spec: Tuple[str, object],
+    initial_route: Route,
+    neighbors: Optional[np.ndarray],
+    sa_kwargs: Dict[str, float],
+) -> None:
+    kind, payload = dist_spec
+    if kind == "shm":
+        name, shape, dtype = payload
+        shm = shared_memory.SharedMemory(name=name)
+        _worker_state["shm"] = shm  # keep the mapping alive for the life of the worker
+        dist: DistanceMatrix = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    elif kind == "oracle":
+        xy, cache_size = payload
+        dist = DistanceOracle(xy, cache_size=cache_size)
+    else:
+        dist = payload
+    _worker_state.update(dist=dist, initial_route=initial_route, neighbors=neighbors, sa_kwargs=sa_kwargs)
+
+
+def _run_sa_chain(seed: int) -> ChainResult:
+    dist = _worker_state["dist"]
+    start = time.process_time()
+    route = simulated_annealing(
+        _worker_state["initial_route"],
+        dist,
+        seed=seed,
+        neighbors=_worker_state["neighbors"],
+        **_worker_state["sa_kwargs"],
+    )
+    elapsed = time.process_time() - start
+    iterations = int(_worker_state["sa_kwargs"].get("iterations", 50000))
+    return ChainResult(route, route_length(route, dist), seed, iterations, elapsed, os.getpid())
+
+
+def multi_start_simulated_annealing(
+    initial_route: Route,
+    dist: DistanceMatrix,
+    *,
+    restarts: int = 4,
+    workers: int = 1,
+    seed: int = 42,
+    neighbors: Optional[np.ndarray] = None,
+    **sa_kwargs: float,
+) -> MultiStartResult:
+    """Run `restarts` independent SA chains (seeds seed, seed+1, ...) and keep the shortest route.
+
+    With workers > 1 the chains run in a process pool. A distance matrix is placed in shared
+    memory once and mapped by every worker; an oracle ships only its coordinates, once per worker.
+    """
+    wall_start = time.perf_counter()
+    seeds = [seed + r for r in range(max(1, restarts))]
+    shm: Optional[shared_memory.SharedMemory] = None
+    if isinstance(dist, DistanceOracle):
+        dist_spec: Tuple[str, object] = ("oracle", (dist.xy, dist.cache_size))
+    elif workers > 1:
+        matrix = np.ascontiguousarray(dist)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, matrix.nbytes))
+        np.ndarray(matrix.shape, dtype=matrix.dtype, buffer=shm.buf)[...] = matrix
+        dist_spec = ("shm", (shm.name, matrix.shape, matrix.dtype.str))
+    else:
+        dist_spec = ("local", dist)
+
+    try:
+        if workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_sa_worker,
+                initargs=(dist_spec, list(initial_route), neighbors, sa_kwargs),
+            ) as pool:
+                chains = list(pool.map(_run_sa_chain, seeds))
+        else:
+            _init_sa_worker(dist_spec, list(initial_route), neighbors, sa_kwargs)
+            try:
+                chains = [_run_sa_chain(s) for s in seeds]
+            finally:
+                _worker_state.clear()
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    best = min(chains, key=lambda c: c.cost)
+    return MultiStartResult(best.route, best.cost, chains, time.perf_counter() - wall_start)
+
+
+def partition_points(
+    points: Union[Sequence[Point], np.ndarray],
+    vehicles: int,
+    *,
+    method: str = "kmeans",
+    seed: int = 42,
+    iterations: int = 25,
+) -> np.ndarray:
+    """Assign each sensor to one of `vehicles` groups; returns an int label per point.
+
+    "kmeans" runs Lloyd's algorithm on the coordinate array (compact, roughly equal-area
+    clusters). "sweep" sorts sensors by angle around the centroid and cuts the sweep into
+    equal-count sectors, which balances the number of sensors per vehicle.
+    """
+    xy = points_to_array(points)
+    n = len(xy)
+    vehicles = max(1, min(vehicles, n))
+    if method == "sweep":
+        center = xy.mean(axis=0)
+        angles = np.arctan2(xy[:, 1] - center[1], xy[:, 0] - center[0])
+        labels = np.empty(n, dtype=np.int64)
+        for label, chunk in enumerate(np.array_split(np.argsort(angles, kind="stable"), vehicles)):
+            labels[chunk] = label
+        return labels
+    if method != "kmeans":
+        raise ValueError(f"Unknown partition method: {method}")
+
+    rng = np.random.default_rng(seed)
+    centers = xy[rng.choice(n, size=vehicles, replace=False)].copy()
+    labels = np.zeros(n, dtype=np.int64)
     for _ in range(iterations):
-        # Propose a 2-opt neighbor
-        i = rng.randrange(1, n - 2)
-        k = rng.randrange(i + 1, n - 1)
-        candidate = two_opt_swap(current, i, k)
-
-        # Compute delta efficiently by recomputing local change (simple full recompute for clarity)
-        candidate_cost = route_length(candidate, dist)
-        delta = candidate_cost - current_cost
-
-        if delta < 0 or rng.random() < math.exp(-delta / max(1e-12, temp)):
-            current = candidate
-            current_cost = candidate_cost
-            if candidate_cost < best_cost:
-                best = candidate
-                best_cost = candidate_cost
-        temp *= cooling_rate
-        if temp < 1e-6:
-            temp = 1e-6
-    return best
+        # |x - c|^2 expanded so the temporary is (n, vehicles) rather than (n, vehicles, 2).
+        d2 = (xy ** 2).sum(axis=1)[:, None] - 2.0 * xy @ centers.T + (centers ** 2).sum(axis=1)[None, :]
+        new_labels = d2.argmin(axis=1)
+        counts = np.bincount(new_labels, minlength=vehicles)
+        for empty in np.flatnonzero(counts == 0):
+            # Re-seed an empty cluster at the point farthest from its current center.
+            far = int(d2[np.arange(n), new_labels].argmax())
+            new_labels[far] = empty
+            d2[far] = 0.0
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        counts = np.bincount(labels, minlength=vehicles)
+        for axis in (0, 1):
+            centers[:, axis] = np.bincount(labels, weights=xy[:, axis], minlength=vehicles) / counts
+    return labels
+
+
+def solve_subtour(xy: np.ndarray, *, sa_iters: int = 0, seed: int = 42, k: int = 10) -> Tuple[Route, float, float]:
+    """Solve one vehicle's sub-TSP on its own coordinates: greedy-edge start, optional SA, then
+    local search. Returns (route in local indices, length, CPU seconds). Top-level so it pickles.
+    """
+    start = time.process_time()
+    n = len(xy)
+    if n < 5:
+        route = list(range(n))
+    else:
+        dist = DistanceOracle(xy)
+        neighbors = build_neighbor_lists(xy, k)
+        route = greedy_edge_route(xy, neighbors)
+        if sa_iters > 0:
+            route = simulated_annealing(route, dist, iterations=sa_iters, seed=seed, neighbors=neighbors)
+        route = local_search(route, dist, neighbors)
+    length = DistanceOracle(xy).route_lengths([route])[0] if n > 1 else 0.0
+    return route, float(length), time.process_time() - start
+
+
+@dataclass
+class SwarmResult:
+    routes: List[Route]  # one closed tour per vehicle, in global sensor indices
+    lengths: List[float]
+    cpu_seconds: List[float]
+    wall_seconds: float = 0.0
+
+    @property
+    def makespan(self) -> float:
+        """Length of the longest vehicle tour, i.e. when the last AUV finishes at equal speed."""
+        return max(self.lengths, default=0.0)
+
+
+def solve_swarm(
+    points: Union[Sequence[Point], np.ndarray],
+    vehicles: int,
+    *,
+    method: str = "kmeans",
+    workers: int = 1,
+    sa_iters: int = 0,
+    seed: int = 42,
+) -> SwarmResult:
+    """Partition sensors across `vehicles` AUVs and solve each sub-tour, in parallel when workers > 1."""
+    wall_start = time.perf_counter()
+    xy = points_to_array(points)
+    labels = partition_points(xy, vehicles, method=method, seed=seed)
+    members = [np.flatnonzero(labels == v) for v in range(int(labels.max()) + 1 if len(labels) else 0)]
+    jobs = [(xy[ids], dict(sa_iters=sa_iters, seed=seed + v)) for v, ids in enumerate(members)]
+
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            futures = [pool.submit(solve_subtour, sub_xy, **kwargs) for sub_xy, kwargs in jobs]
+            solved = [f.result() for f in futures]
+    else:
+        solved = [solve_subtour(sub_xy, **kwargs) for sub_xy, kwargs in jobs]
+
+    routes = [ids[route].tolist() for ids, (route, _, _) in zip(members, solved)]
+    return SwarmResult(
+        routes,
+        [length for _, length, _ in solved],
+        [cpu for _, _, cpu in solved],
+        time.perf_counter() - wall_start,
+    )
 
 
 def plot_routes(
@@ -165,22 +1298,39 @@ def plot_routes(
     title: str = "AUV Sensor Visit Routes",
     save_path: Optional[str] = None,
     show: bool = False,
+    large_route: int = 2000,
+    max_segments: int = 20000,
 ) -> None:
+    """Plot sensors and one closed path per route.
+
+    matplotlib is imported here rather than at module level so solver-only callers never pay
+    for it. Routes longer than `large_route` are drawn as a single LineCollection without
+    markers, decimated to at most `max_segments` segments.
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
 
     if colors is None:
         colors = ["tab:blue", "tab:orange", "tab:green", "tab:red"]
 
+    xy = points_to_array(points)
+    large = len(xy) > large_route
+
     plt.figure(figsize=(8, 6), dpi=120)
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
-    plt.scatter(xs, ys, c="black", s=25, zorder=3, label="Sensors")
+    plt.scatter(xy[:, 0], xy[:, 1], c="black", s=1 if large else 25, zorder=3, label="Sensors", rasterized=large)
 
+    ax = plt.gca()
     for idx, route in enumerate(routes):
         color = colors[idx % len(colors)]
-        path = route + [route[0]] if route else []
-        path_x = [points[i][0] for i in path]
-        path_y = [points[i][1] for i in path]
-        plt.plot(path_x, path_y, "-o", color=color, alpha=0.8, linewidth=1.5, markersize=3, label=labels[idx])
+        path = list(route) + [route[0]] if len(route) else []
+        if len(path) > large_route:
+            stride = max(1, -(-len(path) // max_segments))
+            stops = xy[path[::stride] + [path[-1]]]
+            segments = np.stack([stops[:-1], stops[1:]], axis=1)
+            ax.add_collection(LineCollection(segments, colors=color, alpha=0.8, linewidths=0.6, label=labels[idx]))
+        else:
+            plt.plot(xy[path, 0], xy[path, 1], "-o", color=color, alpha=0.8, linewidth=1.5, markersize=3, label=labels[idx])
+    ax.autoscale_view()
 
     plt.title(title)
     plt.xlabel("X coordinate")
@@ -198,52 +1348,173 @@ def plot_routes(
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Optimize AUV routes (TSP) over sensor coordinates.")
-    parser.add_argument("--csv", type=str, default=None, help="Path to CSV with columns x,y (optional header)")
+    parser.add_argument("--csv", type=str, default=None, help="Path to CSV with columns x,y (optional header) or an (n, 2) .npy array")
     parser.add_argument("--n", type=int, default=30, help="Number of random points if CSV not provided")
     parser.add_argument("--seed", type=int, default=42, help="Random seed")
     parser.add_argument("--sa-iters", type=int, default=20000, help="Simulated annealing iterations")
     parser.add_argument("--sa-temp", type=float, default=100.0, help="Initial temperature for SA")
     parser.add_argument("--cooling", type=float, default=0.995, help="Cooling rate for SA (0-1)")
+    parser.add_argument("--distance", choices=["matrix", "oracle"], default="matrix", help="Precomputed n x n matrix or on-demand oracle (O(n) memory)")
+    parser.add_argument("--cache-size", type=int, default=0, help="LRU cache entries for the distance oracle (0 = off)")
+    parser.add_argument("--init", choices=["greedy", "hilbert", "greedy-edge"], default="greedy", help="Initial route constructor")
+    parser.add_argument("--knn", type=int, default=0, help="Use K-nearest-neighbor lists for greedy and SA moves (0 = off)")
+    parser.add_argument("--local-search", action=argparse.BooleanOptionalAction, default=True, help="Run 2-opt/Or-opt local search after Greedy and SA")
+    parser.add_argument("--progress-every", type=int, default=0, help="Print SA progress every N iterations (0 = off)")
+    parser.add_argument("--checkpoint", type=str, default=None, help="Binary file to checkpoint SA state to")
+    parser.add_argument("--checkpoint-every", type=int, default=None, help="Iterations between checkpoints (default: --progress-every)")
+    parser.add_argument("--resume", action="store_true", help="Continue SA from --checkpoint if it exists")
+    parser.add_argument("--restarts", type=int, default=1, help="Independent SA chains (multi-start)")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for multi-start SA")
+    parser.add_argument("--vehicles", type=int, default=1, help="Split sensors across K AUVs and solve each sub-tour")
+    parser.add_argument("--partition", choices=["kmeans", "sweep"], default="kmeans", help="Sensor partitioning for --vehicles")
+    parser.add_argument("--plot", action=argparse.BooleanOptionalAction, default=True, help="Render the route plot (--no-plot for headless runs)")
     parser.add_argument("--show", action="store_true", help="Display plot window")
     parser.add_argument("--out", type=str, default="task3_routes.png", help="Output plot file path")
 
     args = parser.parse_args()
+    if (args.restarts > 1 or args.workers > 1) and args.vehicles <= 1:
+        unsupported = [flag for flag, value in (("--checkpoint", args.checkpoint), ("--resume", args.resume),
+                                                ("--progress-every", args.progress_every)) if value]
+        if unsupported:
+            parser.error(f"{', '.join(unsupported)}: not supported with --restarts/--workers "
+                         "(multi-start SA does not checkpoint or report progress)")
 
-    points = load_points(args.csv, num_points=args.n, seed=args.seed)
+    points = load_points_array(args.csv, num_points=args.n, seed=args.seed)
     if len(points) < 3:
         raise SystemExit("Need at least 3 points to form a route.")
 
-    dist = compute_distance_matrix(points)
+    if args.vehicles > 1:
+        swarm = solve_swarm(
+            points,
+            args.vehicles,
+            method=args.partition,
+            workers=args.workers,
+            sa_iters=args.sa_iters,
+            seed=args.seed,
+        )
+        print(f"Swarm routes ({len(swarm.routes)} vehicles, {args.partition} partition):")
+        for v, (route, length, cpu) in enumerate(zip(swarm.routes, swarm.lengths, swarm.cpu_seconds), 1):
+            print(f"  AUV {v}: {len(route)} sensors, {length:.2f}  ({cpu:.3f}s CPU)")
+        print(f"  Makespan: {swarm.makespan:.2f}  Total: {sum(swarm.lengths):.2f}")
+        print(f"  Wall time: {swarm.wall_seconds:.3f}s on {args.workers} worker(s), "
+              f"CPU/wall {sum(swarm.cpu_seconds) / max(swarm.wall_seconds, 1e-9):.2f}x")
+        if not args.plot:
+            return
+        plot_routes(
+            points,
+            routes=swarm.routes,
+            labels=[f"AUV {v} ({length:.0f})" for v, length in enumerate(swarm.lengths, 1)],
+            colors=[f"tab:{c}" for c in ("blue", "orange", "green", "red", "purple", "brown", "pink", "gray", "olive", "cyan")],
+            title=f"AUV Swarm Route Optimization ({len(swarm.routes)} vehicles, makespan {swarm.makespan:.0f})",
+            save_path=args.out,
+            show=bool(args.show),
+        )
+        print(f"Saved plot to: {args.out}")
+        return
+
+    if args.distance == "oracle":
+        dist: DistanceMatrix = DistanceOracle(points, cache_size=args.cache_size)
+    else:
+        dist = distance_matrix_array(points)
     rng = random.Random(args.seed)
 
     # Routes
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
     rand_route = random_route(len(points), rng)
-    greedy_route = greedy_nearest_neighbor(dist, start=0)
-    sa_route = simulated_annealing(
-        greedy_route,
-        dist,
-        initial_temp=args.sa_temp,
-        cooling_rate=args.cooling,
-        iterations=args.sa_iters,
-        seed=args.seed,
-    )
+    timings["Random"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    neighbors = build_neighbor_lists(points, args.knn) if args.knn > 0 else None
+    init_name = {"greedy": "Greedy", "hilbert": "Hilbert", "greedy-edge": "Greedy-edge"}[args.init]
+    if args.init == "hilbert":
+        greedy_route = hilbert_curve_route(points, start=0)
+    elif args.init == "greedy-edge":
+        greedy_route = greedy_edge_route(points, neighbors, start=0)
+    elif neighbors is not None:
+        greedy_route = greedy_nearest_neighbor_knn(points, neighbors, start=0)
+    else:
+        greedy_route = greedy_nearest_neighbor(dist, start=0)
+    timings[init_name] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if args.restarts > 1 or args.workers > 1:
+        multi = multi_start_simulated_annealing(
+            greedy_route,
+            dist,
+            restarts=args.restarts,
+            workers=args.workers,
+            seed=args.seed,
+            neighbors=neighbors,
+            initial_temp=args.sa_temp,
+            cooling_rate=args.cooling,
+            iterations=args.sa_iters,
+        )
+        sa_route = multi.best_route
+        print(f"Multi-start SA: {len(multi.chains)} chains on {args.workers} worker(s), "
+              f"wall {multi.wall_seconds:.2f}s, CPU/wall {multi.cpu_utilization:.2f}x")
+        for pid, (chains, rate) in sorted(multi.worker_throughput().items()):
+            print(f"  worker {pid}: {chains} chain(s), {rate:,.0f} it/s")
+    else:
+        if args.resume and args.checkpoint and os.path.exists(args.checkpoint):
+            state = load_checkpoint(args.checkpoint)
+            if len(state.current) != len(points):
+                raise SystemExit(f"Checkpoint {args.checkpoint} is for {len(state.current)} sensors, not {len(points)}.")
+            print(f"Resuming SA from iteration {state.iteration:,} of {state.iterations:,}")
+        else:
+            state = AnnealState.start(
+                greedy_route,
+                dist,
+                initial_temp=args.sa_temp,
+                cooling_rate=args.cooling,
+                iterations=args.sa_iters,
+                seed=args.seed,
+            )
+        progress = anneal(
+            state,
+            dist,
+            neighbors=neighbors,
+            report_every=args.progress_every or max(1, state.iterations),
+            checkpoint_path=args.checkpoint,
+            checkpoint_every=args.checkpoint_every,
+        )
+        try:
+            for iteration, temp, best_cost in progress:
+                if args.progress_every:
+                    print(f"  SA {iteration:>12,} / {state.iterations:,}  temp {temp:.3g}  best {best_cost:.2f}")
+        except KeyboardInterrupt:
+            where = f"; resume with --resume --checkpoint {args.checkpoint}" if args.checkpoint else ""
+            raise SystemExit(f"Interrupted at SA iteration ~{state.iteration:,}{where}")
+        sa_route = state.best_route
+    timings["SA-optimized"] = time.perf_counter() - start
+
+    routes: Dict[str, Route] = {"Random": rand_route, init_name: greedy_route, "SA-optimized": sa_route}
+    if args.local_search:
+        start = time.perf_counter()
+        ls_neighbors = neighbors if neighbors is not None else build_neighbor_lists(points, 10)
+        timings["Neighbor lists"] = time.perf_counter() - start
+        for name, base in ((f"{init_name} + LS", greedy_route), ("SA + LS", sa_route)):
+            start = time.perf_counter()
+            routes[name] = local_search(base, dist, ls_neighbors)
+            timings[name] = time.perf_counter() - start
 
     # Distances
-    rand_len = route_length(rand_route, dist)
-    greedy_len = route_length(greedy_route, dist)
-    sa_len = route_length(sa_route, dist)
+    lengths = {name: route_length(r, dist) for name, r in routes.items()}
 
     print("Route distances (lower is better):")
-    print(f"  Random: {rand_len:.2f}")
-    print(f"  Greedy: {greedy_len:.2f}")
-    print(f"  SA-optimized: {sa_len:.2f}")
+    for name, length in lengths.items():
+        print(f"  {name}: {length:.2f}  ({timings[name]:.3f}s)")
 
     # Plot
+    if not args.plot:
+        return
+    plot_names = ["Random", init_name, "SA-optimized"] + (["SA + LS"] if args.local_search else [])
+    short = {"SA-optimized": "SA"}
     plot_routes(
         points,
-        routes=[rand_route, greedy_route, sa_route],
-        labels=[f"Random ({rand_len:.0f})", f"Greedy ({greedy_len:.0f})", f"SA ({sa_len:.0f})"],
-        title="AUV Swarm Route Optimization (Random vs Greedy vs SA)",
+        routes=[routes[name] for name in plot_names],
+        labels=[f"{short.get(name, name)} ({lengths[name]:.0f})" for name in plot_names],
+        title=f"AUV Swarm Route Optimization (Random vs {init_name} vs SA)",
         save_path=args.out,
         show=bool(args.show),
     )
@@ -0,0 +1,526 @@
+import argparse
+import csv
+import json
+import os
+import math
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+from task3 import (
+    DistanceOracle,
+    IncrementalPlanner,
+    Point,
+    Route,
+    compute_distance_matrix,
+    distance_matrix_array,
+    build_neighbor_lists,
+    euclidean_distance,
+    greedy_nearest_neighbor,
+    greedy_edge_route,
+    greedy_nearest_neighbor_knn,
+    hilbert_curve_route,
+    load_points,
+    load_points_array,
+    local_search,
+    points_to_array,
+    route_length,
+    route_lengths,
+    simulated_annealing,
+    two_opt_swap,
+)
+
+
+def compute_distance_matrix_python(points: Sequence[Point]) -> List[List[float]]:
+    """Original pure-Python double loop over euclidean_distance."""
+    n = len(points)
+    dist: List[List[float]] = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            d = euclidean_distance(points[i], points[j])
+            dist[i][j] = d
+            dist[j][i] = d
+    return dist
+
+
+def load_points_csv_rows(csv_path: str) -> List[Point]:
+    """Original loader: csv.reader with a try/except per row, building a list of tuples."""
+    points: List[Point] = []
+    with open(csv_path, "r", newline="") as f:
+        reader = csv.reader(f)
+        first_row = next(reader, None)
+        if first_row is None:
+            return points
+
+        def try_parse(row: Sequence[str]) -> Optional[Point]:
+            try:
+                x = float(row[0]) if row[0] != "x" else None
+                y = float(row[1]) if row[1] != "y" else None
+                if x is None or y is None:
+                    return None
+                return (x, y)
+            except Exception:
+                return None
+
+        first_point = try_parse(first_row)
+        if first_point is not None:
+            points.append(first_point)
+        for row in reader:
+            if not row:
+                continue
+            p = try_parse(row)
+            if p is not None:
+                points.append(p)
+    return points
+
+
+def list_matrix_bytes(dist: List[List[float]]) -> int:
+    """Approximate footprint of a list-of-lists matrix: row lists plus one boxed float per cell."""
+    n = len(dist)
+    return sys.getsizeof(dist) + sum(sys.getsizeof(row) for row in dist) + n * n * sys.getsizeof(0.0)
+
+
+def simulated_annealing_full_recompute(
+    initial_route: Route,
+    dist: Sequence[Sequence[float]],
+    *,
+    initial_temp: float = 100.0,
+    cooling_rate: float = 0.995,
+    iterations: int = 50000,
+    seed: int = 42,
+) -> Route:
+    """Original SA loop: copies the route and rescores the whole tour on every proposal."""
+    rng = random.Random(seed)
+    current = list(initial_route)
+    best = list(current)
+    current_cost = route_length(current, dist)
+    best_cost = current_cost
+    temp = initial_temp
+
+    n = len(current)
+    if n < 4:
+        return current
+
+    for _ in range(iterations):
+        i = rng.randrange(1, n - 2)
+        k = rng.randrange(i + 1, n - 1)
+        candidate = two_opt_swap(current, i, k)
+        candidate_cost = route_length(candidate, dist)
+        delta = candidate_cost - current_cost
+
+        if delta < 0 or rng.random() < math.exp(-delta / max(1e-12, temp)):
+            current = candidate
+            current_cost = candidate_cost
+            if candidate_cost < best_cost:
+                best = candidate
+                best_cost = candidate_cost
+        temp *= cooling_rate
+        if temp < 1e-6:
+            temp = 1e-6
+    return best
+
+
+def time_call(fn: Callable[[], Route]) -> "tuple[Route, float]":
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def bench_sa(sizes: List[int], iterations: int, seed: int) -> None:
+    """Compare iterations/second of the delta-evaluated SA against the full-recompute baseline."""
+    print(f"{'n':>7} {'baseline it/s':>15} {'delta it/s':>15} {'speedup':>9} {'same route':>11}")
+    for n in sizes:
+        points = load_points(num_points=n, seed=seed)
+        dist = compute_distance_matrix(points)
+        start_route = greedy_nearest_neighbor(dist)
+        kwargs = dict(iterations=iterations, seed=seed)
+
+        base_route, base_time = time_call(lambda: simulated_annealing_full_recompute(start_route, dist, **kwargs))
+        fast_route, fast_time = time_call(lambda: simulated_annealing(start_route, dist, **kwargs))
+
+        base_rate = iterations / base_time if base_time > 0 else float("inf")
+        fast_rate = iterations / fast_time if fast_time > 0 else float("inf")
+        print(
+            f"{n:>7} {base_rate:>15,.0f} {fast_rate:>15,.0f} {fast_rate / base_rate:>8.1f}x "
+            f"{str(base_route == fast_route):>11}"
+        )
+
+
+def bench_matrix(sizes: List[int], seed: int, batch: int = 64) -> None:
+    """Compare list-of-lists and ndarray distance matrices: build time, memory and route scoring."""
+    print(f"{'n':>7} {'list build s':>13} {'f64 build s':>12} {'f32 build s':>12} "
+          f"{'list MB':>9} {'f64 MB':>8} {'f32 MB':>8} {'loop score s':>13} {'batch score s':>14}")
+    rng = random.Random(seed)
+    for n in sizes:
+        points = load_points(num_points=n, seed=seed)
+        dist_list, list_time = time_call(lambda: compute_distance_matrix_python(points))
+        dist64, f64_time = time_call(lambda: distance_matrix_array(points))
+        dist32, f32_time = time_call(lambda: distance_matrix_array(points, dtype=np.float32))
+
+        routes = [rng.sample(range(n), n) for _ in range(batch)]
+        start = time.perf_counter()
+        for r in routes:
+            route_length(r, dist_list)
+        loop_time = time.perf_counter() - start
+        _, batch_time = time_call(lambda: route_lengths(routes, dist64))
+
+        print(
+            f"{n:>7} {list_time:>13.3f} {f64_time:>12.3f} {f32_time:>12.3f} "
+            f"{list_matrix_bytes(dist_list) / 1e6:>9.1f} {dist64.nbytes / 1e6:>8.1f} {dist32.nbytes / 1e6:>8.1f} "
+            f"{loop_time:>13.4f} {batch_time:>14.4f}"
+        )
+        del dist_list
+
+
+def bench_knn(sizes: List[int], iterations: int, seed: int, k: int = 10) -> None:
+    """Compare O(n^2) greedy with neighbor-list greedy, and uniform vs neighbor-list SA proposals."""
+    print(f"{'n':>7} {'greedy s':>9} {'knn build s':>12} {'knn greedy s':>13} "
+          f"{'SA uniform':>11} {'SA knn':>11} {'start len':>11}")
+    for n in sizes:
+        points = load_points(num_points=n, seed=seed)
+        dist = distance_matrix_array(points)
+        greedy, greedy_time = time_call(lambda: greedy_nearest_neighbor(dist))
+        neighbors, build_time = time_call(lambda: build_neighbor_lists(points, k))
+        _, knn_time = time_call(lambda: greedy_nearest_neighbor_knn(points, neighbors))
+
+        uniform = simulated_annealing(greedy, dist, iterations=iterations, seed=seed)
+        guided = simulated_annealing(greedy, dist, iterations=iterations, seed=seed, neighbors=neighbors)
+        print(
+            f"{n:>7} {greedy_time:>9.3f} {build_time:>12.3f} {knn_time:>13.3f} "
+            f"{route_length(uniform, dist):>11.1f} {route_length(guided, dist):>11.1f} {route_length(greedy, dist):>11.1f}"
+        )
+
+
+def bench_construct(sizes: List[int], seed: int, max_matrix_mb: float, k: int = 10) -> None:
+    """Build time and tour length of each initial-route constructor.
+
+    The existing greedy uses the n x n matrix when it fits, otherwise its neighbor-list variant.
+    """
+    print(f"{'n':>8} {'constructor':>16} {'build s':>9} {'length':>12} {'vs greedy':>10}")
+    for n in sizes:
+        points = load_points(num_points=n, seed=seed)
+        oracle = DistanceOracle(points)
+        if n * n * 8 / 1e6 <= max_matrix_mb:
+            dist = distance_matrix_array(points)
+            greedy = ("greedy (matrix)", lambda: greedy_nearest_neighbor(dist))
+        else:
+            greedy = ("greedy (knn)", lambda: greedy_nearest_neighbor_knn(points, k=k))
+        constructors = [greedy, ("hilbert", lambda: hilbert_curve_route(points)),
+                        ("greedy-edge", lambda: greedy_edge_route(points, k=k))]
+        baseline = None
+        for name, build in constructors:
+            route, elapsed = time_call(build)
+            length = route_length(route, oracle)
+            baseline = baseline or length
+            print(f"{n:>8} {name:>16} {elapsed:>9.3f} {length:>12.1f} {length / baseline:>9.3f}x")
+
+
+def bench_incremental(sizes: List[int], seed: int, changes: int = 5, rounds: int = 5) -> None:
+    """Full solve (greedy-edge + local search) versus incremental re-planning after small edits."""
+    print(f"{'n':>8} {'full solve s':>13} {'update ms (median)':>19} {'update ms (max)':>16} {'length drift':>13}")
+    for n in sizes:
+        points = load_points(num_points=n, seed=seed)
+        planner, full_time = time_call(lambda: IncrementalPlanner(points))
+        start_len = planner.length
+        rng = random.Random(seed)
+        times = []
+        for _ in range(rounds):
+            inserted = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(changes)]
+            deleted = rng.sample(np.flatnonzero(planner.alive).tolist(), changes)
+            _, elapsed = time_call(lambda: planner.apply_changes(inserted, deleted))
+            times.append(elapsed * 1000)
+        times.sort()
+        print(f"{n:>8} {full_time:>13.2f} {times[len(times) // 2]:>19.1f} {times[-1]:>16.1f} "
+              f"{planner.length / start_len - 1:>+12.2%}")
+
+
+def bench_loader(rows: List[int], seed: int) -> None:
+    """Row-by-row CSV loader versus the chunked NumPy loader, plus memory-mapped .npy input."""
+    print(f"{'rows':>11} {'csv.reader s':>13} {'chunked s':>10} {'npy mmap s':>11} "
+          f"{'list MB':>9} {'array MB':>9} {'same':>5}")
+    rng = np.random.default_rng(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in rows:
+            xy = rng.uniform(0.0, 100.0, size=(n, 2))
+            csv_path = os.path.join(tmp, f"points_{n}.csv")
+            npy_path = os.path.join(tmp, f"points_{n}.npy")
+            np.savetxt(csv_path, xy, fmt="%.6f", delimiter=",", header="x,y", comments="")
+            np.save(npy_path, xy)
+
+            old, old_time = time_call(lambda: load_points_csv_rows(csv_path))
+            new, new_time = time_call(lambda: load_points_array(csv_path))
+            mapped, npy_time = time_call(lambda: load_points_array(npy_path))
+            list_mb = (sys.getsizeof(old) + len(old) * (sys.getsizeof((0.0, 0.0)) + 2 * sys.getsizeof(0.0))) / 1e6
+            same = np.array_equal(np.asarray(old), new) and np.array_equal(mapped, xy)
+            print(f"{n:>11,} {old_time:>13.2f} {new_time:>10.2f} {npy_time:>11.4f} "
+                  f"{list_mb:>9.1f} {new.nbytes / 1e6:>9.1f} {str(same):>5}")
+            del old, new, mapped
+
+
+def rss_probe(mode: str, n: int, iterations: int, seed: int) -> None:
+    """Run one greedy + SA solve in this process and print its peak RSS as JSON (used by bench_oracle)."""
+    points = load_points(num_points=n, seed=seed)
+    start = time.perf_counter()
+    if mode == "oracle":
+        dist = DistanceOracle(points)
+    else:
+        dist = distance_matrix_array(points)
+    route = simulated_annealing(greedy_nearest_neighbor(dist), dist, iterations=iterations, seed=seed)
+    length = route_length(route, dist)
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is reported in KiB on Linux.
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"peak_rss_mb": peak_mb, "seconds": elapsed, "length": length}))
+
+
+def bench_oracle(sizes: List[int], iterations: int, seed: int, max_matrix_mb: float) -> None:
+    """Peak RSS of a full solve with the n x n matrix versus the on-demand distance oracle.
+
+    Each measurement runs in a fresh interpreter because peak RSS never goes back down.
+    """
+    print(f"{'n':>8} {'matrix RSS MB':>14} {'matrix s':>9} {'oracle RSS MB':>14} {'oracle s':>9}")
+    for n in sizes:
+        row = []
+        for mode in ("matrix", "oracle"):
+            if mode == "matrix" and n * n * 8 / 1e6 > max_matrix_mb:
+                row.append("skipped".rjust(14) + " " + "-".rjust(9))
+                continue
+            out = subprocess.run(
+                [sys.executable, __file__, "--rss-probe", mode, "--sizes", str(n),
+                 "--sa-iters", str(iterations), "--seed", str(seed)],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            stats = json.loads(out.strip().splitlines()[-1])
+            row.append(f"{stats['peak_rss_mb']:>14.1f} {stats['seconds']:>9.2f}")
+        print(f"{n:>8} " + " ".join(row))
+
+
+SUITE_KINDS = ("uniform", "clustered")
+
+
+def make_instance(kind: str, n: int, seed: int, workdir: str) -> np.ndarray:
+    """Reproducible benchmark field, read back through load_points like a real survey file.
+
+    "uniform" uses load_points' own generator; "clustered" scatters Gaussian blobs around
+    random centers (about one per 250 sensors) and round-trips them through a CSV file.
+    """
+    if kind == "uniform":
+        return points_to_array(load_points(num_points=n, seed=seed))
+    if kind != "clustered":
+        raise ValueError(f"unknown instance kind {kind!r}")
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(10.0, 90.0, size=(max(4, n // 250), 2))
+    xy = centers[rng.integers(0, len(centers), size=n)] + rng.normal(0.0, 1.5, size=(n, 2))
+    path = os.path.join(workdir, f"clustered_{n}_{seed}.csv")
+    np.savetxt(path, np.clip(xy, 0.0, 100.0), fmt="%.9f", delimiter=",", header="x,y", comments="")
+    return points_to_array(load_points(path))
+
+
+def mst_lower_bound(xy: np.ndarray) -> float:
+    """Length of the Euclidean minimum spanning tree, a lower bound on any closed tour.
+
+    With scipy the MST is taken over the Delaunay edges (which contain it) in O(n log n);
+    without scipy it falls back to an O(n^2) array-based Prim, fine up to a few 10k points.
+    """
+    n = len(xy)
+    if n < 2:
+        return 0.0
+    try:
+        from scipy.sparse import coo_matrix
+        from scipy.sparse.csgraph import minimum_spanning_tree
+        from scipy.spatial import Delaunay
+    except ImportError:
+        best = np.hypot(*(xy - xy[0]).T)
+        best[0] = np.inf
+        in_tree = np.zeros(n, dtype=bool)
+        in_tree[0] = True
+        total = 0.0
+        for _ in range(n - 1):
+            j = int(np.argmin(best))
+            total += float(best[j])
+            in_tree[j] = True
+            best = np.minimum(best, np.hypot(*(xy - xy[j]).T))
+            best[in_tree] = np.inf
+        return total
+    tri = Delaunay(xy)
+    simplices = tri.simplices
+    edges = np.concatenate([simplices[:, [0, 1]], simplices[:, [1, 2]], simplices[:, [0, 2]]])
+    # Interior edges are shared by two triangles and coo_matrix would sum the duplicates.
+    edges = np.unique(np.sort(edges, axis=1), axis=0)
+    weights = np.hypot(*(xy[edges[:, 0]] - xy[edges[:, 1]]).T)
+    # Delaunay skips exact duplicates; they add zero length, so the forest's total is still a valid bound.
+    graph = coo_matrix((weights, (edges[:, 0], edges[:, 1])), shape=(n, n))
+    return float(minimum_spanning_tree(graph).sum())
+
+
+def _measure(fn: Callable[[], Route], track_memory: bool) -> "tuple[Route, float, Optional[float]]":
+    """Time fn untraced, then (optionally) rerun it under tracemalloc for its peak allocation in MB.
+
+    Tracing slows pure-Python code several-fold, so the two are never taken from the same run.
+    """
+    route, elapsed = time_call(fn)
+    if not track_memory:
+        return route, elapsed, None
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return route, elapsed, peak / 1e6
+
+
+def run_suite(
+    sizes: List[int],
+    kinds: Sequence[str],
+    sa_iters: int,
+    seed: int,
+    out_path: str,
+    *,
+    k: int = 10,
+    track_memory: bool = True,
+) -> dict:
+    """Run every constructor and optimizer on each seeded instance and write the results as JSON.
+
+    Optimizer stages start from their constructor's route and are timed on their own work only.
+    Each record carries wall time, peak traced memory, SA iterations/s and the gap to the MST bound.
+    """
+    records = []
+    print(f"{'instance':>18} {'algorithm':>22} {'wall s':>9} {'peak MB':>9} {'it/s':>11} {'length':>12} {'gap':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind in kinds:
+            for n in sizes:
+                xy = make_instance(kind, n, seed, tmp)
+                oracle = DistanceOracle(xy)
+                bound, bound_time = time_call(lambda: mst_lower_bound(xy))
+                neighbors, nb_time, nb_peak = _measure(lambda: build_neighbor_lists(xy, k=k), track_memory)
+                instance = f"{kind}-{n}"
+                print(f"{instance:>18} {'(mst bound)':>22} {bound_time:>9.3f} {'':>9} {'':>11} {bound:>12.1f}")
+                print(f"{instance:>18} {'(neighbor lists)':>22} {nb_time:>9.3f} "
+                      f"{nb_peak if nb_peak is not None else float('nan'):>9.1f}")
+                records.append({
+                    "instance": instance, "kind": kind, "n": n, "seed": seed, "algorithm": "neighbor-lists",
+                    "start": None, "wall_s": nb_time, "peak_mb": nb_peak, "iters_per_s": None,
+                    "iterations": None, "length": None, "lower_bound": bound, "gap": None,
+                })
+
+                stages = [
+                    ("greedy", None, lambda: greedy_nearest_neighbor_knn(xy, neighbors)),
+                    ("hilbert", None, lambda: hilbert_curve_route(xy)),
+                    ("greedy-edge", None, lambda: greedy_edge_route(xy, neighbors)),
+                    ("greedy+ls", "greedy", lambda r: local_search(r, oracle, neighbors)),
+                    ("hilbert+ls", "hilbert", lambda r: local_search(r, oracle, neighbors)),
+                    ("greedy-edge+ls", "greedy-edge", lambda r: local_search(r, oracle, neighbors)),
+                    ("greedy-edge+sa", "greedy-edge", lambda r: simulated_annealing(
+                        r, oracle, iterations=sa_iters, seed=seed, neighbors=neighbors)),
+                    ("greedy-edge+sa+ls", "greedy-edge+sa", lambda r: local_search(r, oracle, neighbors)),
+                ]
+                routes = {}
+                for name, parent, step in stages:
+                    fn = step if parent is None else (lambda s=step, r=routes[parent]: s(list(r)))
+                    route, elapsed, peak = _measure(fn, track_memory)
+                    routes[name] = route
+                    length = route_length(route, oracle)
+                    rate = sa_iters / elapsed if name.endswith("+sa") and elapsed > 0 else None
+                    gap = length / bound - 1 if bound > 0 else None
+                    records.append({
+                        "instance": instance, "kind": kind, "n": n, "seed": seed, "algorithm": name,
+                        "start": parent, "wall_s": elapsed, "peak_mb": peak, "iters_per_s": rate,
+                        "iterations": sa_iters if name.endswith("+sa") else None,
+                        "length": length, "lower_bound": bound, "gap": gap,
+                    })
+                    print(f"{instance:>18} {name:>22} {elapsed:>9.3f} "
+                          f"{peak if peak is not None else float('nan'):>9.1f} "
+                          f"{rate if rate is not None else float('nan'):>11.0f} {length:>12.1f} "
+                          f"{gap if gap is not None else float('nan'):>+8.2%}")
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "config": {"sizes": sizes, "kinds": list(kinds), "sa_iters": sa_iters, "seed": seed, "k": k,
+                   "lower_bound": "euclidean-mst"},
+        "results": records,
+    }
+    with open(out_path, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    print(f"Wrote {len(records)} results to {out_path}")
+    return report
+
+
+def compare_suites(old_path: str, new_path: str) -> None:
+    """Print time ratio and gap change for every (instance, algorithm) present in both suite files."""
+    with open(old_path, encoding="utf-8") as fh:
+        old = {(r["instance"], r["algorithm"]): r for r in json.load(fh)["results"]}
+    with open(new_path, encoding="utf-8") as fh:
+        new = json.load(fh)["results"]
+    print(f"{'instance':>18} {'algorithm':>22} {'old s':>9} {'new s':>9} {'time':>8} {'old gap':>8} {'new gap':>8}")
+    for rec in new:
+        base = old.get((rec["instance"], rec["algorithm"]))
+        if base is None:
+            continue
+        ratio = rec["wall_s"] / base["wall_s"] if base["wall_s"] else float("nan")
+        old_gap = base["gap"] if base["gap"] is not None else float("nan")
+        new_gap = rec["gap"] if rec["gap"] is not None else float("nan")
+        print(f"{rec['instance']:>18} {rec['algorithm']:>22} {base['wall_s']:>9.3f} {rec['wall_s']:>9.3f} "
+              f"{ratio:>7.2f}x {old_gap:>+8.2%} {new_gap:>+8.2%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmarks for the AUV route optimizer in task3.")
+    parser.add_argument("--bench", choices=["sa", "matrix", "knn", "oracle", "construct", "incremental", "loader"], nargs="+",
+                        default=["sa", "matrix", "knn", "oracle", "construct", "incremental"], help="Benchmarks to run")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000], help="Point counts to test")
+    parser.add_argument("--sa-iters", type=int, default=20000, help="SA iterations per run")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--loader-rows", type=int, nargs="+", default=[1_000_000, 10_000_000], help="CSV row counts for the loader benchmark")
+    parser.add_argument("--max-matrix-mb", type=float, default=4000.0, help="Skip matrix runs whose n x n float64 matrix exceeds this")
+    parser.add_argument("--suite", action="store_true",
+                        help="Run the full constructor/optimizer suite on uniform and clustered instances and write JSON")
+    parser.add_argument("--suite-sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="Point counts for --suite")
+    parser.add_argument("--suite-kinds", choices=SUITE_KINDS, nargs="+", default=list(SUITE_KINDS), help="Instance kinds for --suite")
+    parser.add_argument("--suite-out", default="task3_suite.json", help="Where --suite writes its results")
+    parser.add_argument("--suite-memory", action=argparse.BooleanOptionalAction, default=True,
+                        help="Rerun each --suite step under tracemalloc to record peak memory (roughly doubles suite time)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), default=None, help="Compare two --suite result files")
+    parser.add_argument("--rss-probe", choices=["matrix", "oracle"], default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.rss_probe:
+        rss_probe(args.rss_probe, args.sizes[0], args.sa_iters, args.seed)
+        return
+    if args.compare:
+        compare_suites(*args.compare)
+        return
+    if args.suite:
+        run_suite(args.suite_sizes, args.suite_kinds, args.sa_iters, args.seed, args.suite_out,
+                  track_memory=args.suite_memory)
+        return
+
+    if "sa" in args.bench:
+        bench_sa(args.sizes, args.sa_iters, args.seed)
+    if "matrix" in args.bench:
+        bench_matrix(args.sizes, args.seed)
+    if "knn" in args.bench:
+        bench_knn(args.sizes, args.sa_iters, args.seed)
+    if "oracle" in args.bench:
+        bench_oracle(args.sizes, args.sa_iters, args.seed, args.max_matrix_mb)
+    if "construct" in args.bench:
+        bench_construct(args.sizes, args.seed, args.max_matrix_mb)
+    if "incremental" in args.bench:
+        bench_incremental(args.sizes, args.seed)
+    if "loader" in args.bench:
+        bench_loader(args.loader_rows, args.seed)
+
+
+if __name__ == "__main__":
+    main()
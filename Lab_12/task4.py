@@ -1,11 +1,12 @@
 import random
-import time
 import heapq
-from typing import List, Dict, Tuple, Optional
+from typing import Any, Callable, List, Dict, Tuple, Optional
 from datetime import datetime, timedelta
 import json
 import csv
 
+import timing
+
 
 class Stock:
     """Class to represent a stock with price data and performance metrics."""
@@ -220,80 +221,66 @@ class FinTechAnalyzer:
         self.stocks: List[Stock] = []
         self.hash_map = StockHashMap()
         self.generator = StockDataGenerator()
-        self.performance_stats = {}
+        self.stock_dict: Dict[str, Stock] = {}
+        self.performance_stats: Dict[str, timing.Timing] = {}
     
     def load_stock_data(self, num_stocks: int = 100):
         """Load or generate stock data."""
         print(f"📊 Loading {num_stocks} stocks...")
         self.stocks = self.generator.generate_stock_data(num_stocks)
         
-        # Build hash map
-        for stock in self.stocks:
-            self.hash_map.insert(stock)
+        self._index_stocks()
         
         print(f"✅ Loaded {len(self.stocks)} stocks successfully!")
     
+    def _index_stocks(self):
+        """Build the hash map (and the plain dict it is compared against) over self.stocks."""
+        self.hash_map = StockHashMap()
+        for stock in self.stocks:
+            self.hash_map.insert(stock)
+        self.stock_dict = {stock.symbol: stock for stock in self.stocks}
+    
     def heap_sort_stocks(self) -> Tuple[List[Stock], float]:
         """Sort stocks using heap sort algorithm."""
-        start_time = time.time()
-        sorted_stocks = HeapSort.heap_sort(self.stocks)
-        end_time = time.time()
-        
-        sort_time = end_time - start_time
-        self.performance_stats['Heap Sort'] = sort_time
-        
-        return sorted_stocks, sort_time
+        return self._timed('Heap Sort', lambda: HeapSort.heap_sort(self.stocks))
     
     def standard_sort_stocks(self) -> Tuple[List[Stock], float]:
         """Sort stocks using Python's built-in sorted function."""
-        start_time = time.time()
-        sorted_stocks = sorted(self.stocks, key=lambda x: x.percentage_change, reverse=True)
-        end_time = time.time()
-        
-        sort_time = end_time - start_time
-        self.performance_stats['Standard Sort'] = sort_time
-        
-        return sorted_stocks, sort_time
+        return self._timed('Standard Sort', lambda: sorted(self.stocks, key=lambda x: x.percentage_change, reverse=True))
     
     def hash_search_stock(self, symbol: str) -> Tuple[Optional[Stock], float]:
         """Search for stock using custom hash map."""
-        start_time = time.time()
-        stock = self.hash_map.get(symbol)
-        end_time = time.time()
-        
-        search_time = end_time - start_time
-        self.performance_stats[f'Hash Search ({symbol})'] = search_time
-        
-        return stock, search_time
+        return self._timed(f'Hash Search ({symbol})', lambda: self.hash_map.get(symbol))
     
     def dict_search_stock(self, symbol: str) -> Tuple[Optional[Stock], float]:
         """Search for stock using Python dictionary."""
-        # Build dictionary for comparison
-        stock_dict = {stock.symbol: stock for stock in self.stocks}
-        
-        start_time = time.time()
-        stock = stock_dict.get(symbol.upper())
-        end_time = time.time()
-        
-        search_time = end_time - start_time
-        self.performance_stats[f'Dict Search ({symbol})'] = search_time
-        
-        return stock, search_time
+        return self._timed(f'Dict Search ({symbol})', lambda: self.stock_dict.get(symbol.upper()))
     
     def linear_search_stock(self, symbol: str) -> Tuple[Optional[Stock], float]:
         """Search for stock using linear search."""
-        start_time = time.time()
-        stock = None
+        return self._timed(f'Linear Search ({symbol})', lambda: self._linear_find(symbol))
+    
+    def _timed(self, operation: str, fn: Callable[[], Any]) -> Tuple[Any, float]:
+        """Call fn once, record the time under operation in performance_stats, return (result, seconds)."""
+        result, seconds = timing.time_once(fn)
+        self.performance_stats[operation] = timing.Timing(operation, [round(seconds * 1e9)])
+        return result, seconds
+    
+    def _linear_find(self, symbol: str) -> Optional[Stock]:
+        symbol = symbol.upper()
         for s in self.stocks:
-            if s.symbol == symbol.upper():
-                stock = s
-                break
-        end_time = time.time()
-        
-        search_time = end_time - start_time
-        self.performance_stats[f'Linear Search ({symbol})'] = search_time
-        
-        return stock, search_time
+            if s.symbol == symbol:
+                return s
+        return None
+    
+    def _sort_candidates(self) -> Dict[str, Callable[[], List[Stock]]]:
+        return {'Heap Sort': lambda: HeapSort.heap_sort(self.stocks),
+                'Standard Sort': lambda: sorted(self.stocks, key=lambda x: x.percentage_change, reverse=True)}
+    
+    def _search_candidates(self, symbol: str) -> Dict[str, Callable[[], Optional[Stock]]]:
+        return {'Hash Search': lambda: self.hash_map.get(symbol),
+                'Dict Search': lambda: self.stock_dict.get(symbol.upper()),
+                'Linear Search': lambda: self._linear_find(symbol)}
     
     def display_sorted_stocks(self, sorted_stocks: List[Stock], title: str, limit: int = 20):
         """Display sorted stocks in a formatted table."""
@@ -315,22 +302,26 @@ class FinTechAnalyzer:
         print(f"\n⚡ SORTING PERFORMANCE COMPARISON ⚡")
         print("=" * 60)
         
-        # Test heap sort
-        heap_sorted, heap_time = self.heap_sort_stocks()
+        heap_sorted, _ = self.heap_sort_stocks()
+        standard_sorted, _ = self.standard_sort_stocks()
         
-        # Test standard sort
-        standard_sorted, standard_time = self.standard_sort_stocks()
+        # Time both over repeated runs after a warmup
+        timings = timing.compare(self._sort_candidates())
+        self.performance_stats.update(timings)
+        heap_time, standard_time = timings['Heap Sort'].median, timings['Standard Sort'].median
         
         # Display results
-        print(f"Heap Sort:     {heap_time:.6f} seconds")
-        print(f"Standard Sort: {standard_time:.6f} seconds")
-        
-        if heap_time > 0:
-            speed_ratio = standard_time / heap_time
-            if speed_ratio > 1:
-                print(f"Heap Sort is {speed_ratio:.2f}x faster than Standard Sort")
-            else:
-                print(f"Standard Sort is {1/speed_ratio:.2f}x faster than Heap Sort")
+        print(f"Heap Sort:     {timings['Heap Sort']}")
+        print(f"Standard Sort: {timings['Standard Sort']}")
+        
+        speed_ratio = standard_time / heap_time
+        _, clear = timing.fastest(timings)
+        if not clear:
+            print("Heap Sort and Standard Sort are within run-to-run noise of each other")
+        elif speed_ratio > 1:
+            print(f"Heap Sort is {speed_ratio:.2f}x faster than Standard Sort")
+        else:
+            print(f"Standard Sort is {1/speed_ratio:.2f}x faster than Heap Sort")
         
         return heap_sorted, standard_sorted
     
@@ -339,25 +330,23 @@ class FinTechAnalyzer:
         print(f"\n🔍 SEARCH PERFORMANCE COMPARISON FOR '{symbol}' 🔍")
         print("=" * 70)
         
-        # Test hash search
-        hash_result, hash_time = self.hash_search_stock(symbol)
-        
-        # Test dict search
-        dict_result, dict_time = self.dict_search_stock(symbol)
+        hash_result, _ = self.hash_search_stock(symbol)
+        dict_result, _ = self.dict_search_stock(symbol)
+        linear_result, _ = self.linear_search_stock(symbol)
         
-        # Test linear search
-        linear_result, linear_time = self.linear_search_stock(symbol)
+        # Time all three over repeated runs after a warmup
+        timings = timing.compare(self._search_candidates(symbol))
+        self.performance_stats.update((f'{name} ({symbol})', measured) for name, measured in timings.items())
         
         # Display results
-        print(f"Hash Search:   {hash_time:.6f} seconds")
-        print(f"Dict Search:   {dict_time:.6f} seconds")
-        print(f"Linear Search: {linear_time:.6f} seconds")
+        print(f"Hash Search:   {timings['Hash Search']}")
+        print(f"Dict Search:   {timings['Dict Search']}")
+        print(f"Linear Search: {timings['Linear Search']}")
         
         # Find fastest
-        times = [('Hash Search', hash_time), ('Dict Search', dict_time), ('Linear Search', linear_time)]
-        fastest = min(times, key=lambda x: x[1])
+        fastest, clear = timing.fastest(timings)
         
-        print(f"\n🏆 Fastest: {fastest[0]}")
+        print(f"\n🏆 Fastest: {fastest}" + ("" if clear else " (within run-to-run noise of the next)"))
         
         # Show results
         if hash_result:
@@ -401,9 +390,9 @@ class FinTechAnalyzer:
             print("No performance data available. Run some operations first.")
             return
         
-        print("Algorithm Performance:")
-        for operation, time_taken in self.performance_stats.items():
-            print(f"  {operation}: {time_taken:.6f}s")
+        print("Algorithm Performance (per call):")
+        for operation, measured in self.performance_stats.items():
+            print(f"  {operation}: {measured}")
         
         # Recommendations
         print(f"\n💡 RECOMMENDATIONS:")
@@ -411,6 +400,35 @@ class FinTechAnalyzer:
         print("• Use Heap Sort for real-time sorting of large datasets")
         print("• Standard Python sort() is optimized and often faster for small datasets")
         print("• Consider hybrid approaches based on data size and access patterns")
+    
+    def scaling_analysis(self, sizes: Tuple[int, ...] = (100, 1000, 10000, 100000)):
+        """Sweep the sorts and searches over growing synthetic markets and fit how each scales."""
+        print(f"\n📐 SCALING ANALYSIS 📐")
+        print("=" * 70)
+        saved = self.stocks
+        
+        def sort_setup(n):
+            self.load_synthetic_stocks(n)
+            return self._sort_candidates()
+        
+        def search_setup(n):
+            self.load_synthetic_stocks(n)
+            return self._search_candidates(self.stocks[-1].symbol)  # worst case for the linear scan
+        
+        try:
+            print("Sorting (median per sort):")
+            print(timing.format_sweep(timing.sweep(sizes, sort_setup, repeat=5)))
+            print("\nSearching for the last symbol (median per lookup):")
+            print(timing.format_sweep(timing.sweep(sizes, search_setup, repeat=5)))
+        finally:
+            self.stocks = saved
+            self._index_stocks()
+        print("\n💡 k is the fitted exponent of time ~ n^k: about 0 for O(1), 1 for O(n), a bit over 1 for O(n log n)")
+    
+    def load_synthetic_stocks(self, num_stocks: int):
+        """Replace the market with num_stocks generated stocks (tickers S000000, S000001, ...)."""
+        self.stocks = [Stock(f"S{i:06d}", 100.0, random.uniform(50, 150)) for i in range(num_stocks)]
+        self._index_stocks()
 
 
 def main():
@@ -438,9 +456,10 @@ def main():
         print("3. Display Market Summary")
         print("4. Performance Analysis")
         print("5. Load New Dataset")
-        print("6. Exit")
+        print("6. Scaling Analysis")
+        print("7. Exit")
         
-        choice = input("\nEnter your choice (1-6): ").strip()
+        choice = input("\nEnter your choice (1-7): ").strip()
         
         if choice == '1':
             heap_sorted, standard_sorted = analyzer.compare_sorting_performance()
@@ -471,11 +490,14 @@ def main():
                 analyzer.load_stock_data(100)
         
         elif choice == '6':
+            analyzer.scaling_analysis()
+        
+        elif choice == '7':
             print("👋 Thank you for using AI-Powered FinTech Lab!")
             break
         
         else:
-            print("❌ Invalid choice. Please enter 1-6.")
+            print("❌ Invalid choice. Please enter 1-7.")
 
 
 if __name__ == "__main__":
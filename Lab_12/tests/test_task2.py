@@ -0,0 +1,63 @@
+import pytest
+
+from task2 import LibraryManager, iter_books
+
+BOOKS = [
+    ("Alpha", "Jane  Smith"),
+    ("Beta", "Jane Smith"),
+    ("Gamma", " Zed Alpha"),
+    ("Delta", "Bob Zed"),
+    ("The the Hobbit", "J. R. R. Tolkien"),
+    ("Hobbit, the!", "Tolkien the Writer"),
+]
+
+
+def titles(books):
+    return sorted(book.title for book in books)
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("Jane  Smith", ["Alpha", "Beta"]),
+    ("jane smith", ["Alpha", "Beta"]),
+    ("Zed", ["Delta", "Gamma"]),
+    ("  zed ", ["Delta", "Gamma"]),
+])
+def test_author_prefix_search_ignores_irregular_whitespace(query, expected):
+    library = LibraryManager()
+    for title, author in BOOKS:
+        library.add_book(title, author)
+    assert titles(library.binary_search(query)[0]) == expected
+
+
+def snapshot(library):
+    index = library.index
+    return (
+        [(book.title, book.author) for book in library.sorted_books],
+        index.postings, index.tfs, index.vocab, index.grams,
+        list(index.title_lengths), list(index.author_lengths),
+        library.title_prefixes.complete('', len(library.books)),
+        library.author_prefixes.complete('', len(library.books)),
+    )
+
+
+def test_bulk_and_shard_loads_match_add_book(tmp_path):
+    rows = BOOKS + [(f"Book {i} of the {i % 7} series", f"Author {i % 13}") for i in range(300)]
+    shards = []
+    for s in range(3):
+        path = tmp_path / f"shard{s}.csv"
+        path.write_text("title,author\n" + "".join(f'"{t}","{a}"\n' for t, a in rows[s::3]))
+        shards.append(str(path))
+    sharded_rows = [row for path in shards for row in iter_books(path)]
+
+    reference = LibraryManager()
+    for title, author in sharded_rows:
+        reference.add_book(title, author)
+    reference.sort_books_by_author()
+
+    bulk = LibraryManager()
+    bulk.bulk_load(iter(sharded_rows))
+    assert snapshot(bulk) == snapshot(reference)
+    for workers in (1, 2):
+        sharded = LibraryManager()
+        sharded.load_shards(shards, workers=workers)
+        assert snapshot(sharded) == snapshot(reference)
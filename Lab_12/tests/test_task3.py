@@ -0,0 +1,39 @@
+import sys
+
+import numpy as np
+import pytest
+
+import task3
+from task3_benchmark import simulated_annealing_full_recompute
+
+
+@pytest.mark.parametrize("n", [5, 30, 80])
+def test_delta_sa_matches_full_rescoring(n):
+    points = task3.load_points(num_points=n, seed=7)
+    dist = task3.compute_distance_matrix(points)
+    start = task3.greedy_nearest_neighbor(dist)
+    kwargs = dict(iterations=3000, seed=11)
+    assert task3.simulated_annealing(start, dist, **kwargs) == simulated_annealing_full_recompute(start, dist, **kwargs)
+
+
+@pytest.mark.parametrize("content", ["", "x,y\n", "x,y\n\n\n"])
+def test_header_only_csv_loads_no_points(tmp_path, content):
+    path = tmp_path / "points.csv"
+    path.write_text(content)
+    array = task3.load_points_array(str(path))
+    assert array.shape == (0, 2) and array.dtype == np.float64
+    assert task3.load_points(str(path)) == []
+
+
+def test_cli_reports_too_few_points_for_header_only_csv(tmp_path, monkeypatch):
+    path = tmp_path / "points.csv"
+    path.write_text("x,y\n")
+    monkeypatch.setattr(sys, "argv", ["task3.py", "--csv", str(path), "--no-plot"])
+    with pytest.raises(SystemExit, match="Need at least 3 points"):
+        task3.main()
+
+
+def test_csv_with_header_loads_points(tmp_path):
+    path = tmp_path / "points.csv"
+    path.write_text("x,y\n1,2\n3.5,4\n")
+    assert task3.load_points(str(path)) == [(1.0, 2.0), (3.5, 4.0)]
@@ -0,0 +1,139 @@
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass
+class Timing:
+    """Repeated measurements of one operation; every statistic is seconds per call."""
+    name: str
+    runs_ns: List[int] = field(default_factory=list)  # duration of each run of `loops` calls
+    loops: int = 1
+
+    def _per_call(self) -> List[float]:
+        return sorted(ns / self.loops / 1e9 for ns in self.runs_ns)
+
+    @property
+    def min(self) -> float:
+        return self._per_call()[0]
+
+    @property
+    def median(self) -> float:
+        per_call = self._per_call()
+        middle = len(per_call) // 2
+        return per_call[middle] if len(per_call) % 2 else (per_call[middle - 1] + per_call[middle]) / 2
+
+    @property
+    def p95(self) -> float:
+        per_call = self._per_call()
+        return per_call[min(len(per_call) - 1, math.ceil(0.95 * len(per_call)) - 1)]
+
+    def __str__(self) -> str:
+        if len(self.runs_ns) == 1 and self.loops == 1:
+            return f"{format_seconds(self.median)} (single call)"
+        return (f"{format_seconds(self.median)} median (min {format_seconds(self.min)}, "
+                f"p95 {format_seconds(self.p95)}, {len(self.runs_ns)}x{self.loops} calls)")
+
+
+def format_seconds(seconds: float) -> str:
+    """Seconds with a unit that keeps three significant digits (ns, us, ms or s)."""
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def time_once(fn: Callable[[], Any]) -> Tuple[Any, float]:
+    """Call fn once and return (its result, elapsed seconds) measured with perf_counter_ns."""
+    start = time.perf_counter_ns()
+    result = fn()
+    return result, (time.perf_counter_ns() - start) / 1e9
+
+
+def calibrate(fn: Callable[[], Any], min_run_ns: int = 2_000_000) -> int:
+    """Calls per run so a run lasts at least min_run_ns, doubling from 1 like timeit.autorange.
+
+    Fast operations are far below the clock's resolution and overhead, so they are timed in
+    loops; anything slower than min_run_ns runs once per measurement.
+    """
+    loops = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(loops):
+            fn()
+        if time.perf_counter_ns() - start >= min_run_ns or loops >= 1 << 20:
+            return loops
+        loops *= 2
+
+
+def measure(fn: Callable[[], Any], name: str = "", warmup: int = 1, repeat: int = 7,
+            loops: Optional[int] = None, min_run_ns: int = 2_000_000) -> Timing:
+    """Time fn: warmup calls first, then `repeat` runs of `loops` calls each (calibrated if not given)."""
+    return compare({name: fn}, warmup, repeat, loops, min_run_ns)[name]
+
+
+def compare(candidates: Dict[str, Callable[[], Any]], warmup: int = 1, repeat: int = 7,
+            loops: Optional[int] = None, min_run_ns: int = 2_000_000) -> Dict[str, Timing]:
+    """Time several operations under the same conditions.
+
+    Runs are interleaved round-robin (a run of each candidate per round), so drift from CPU
+    frequency changes, caches or other processes hits every candidate alike instead of
+    favouring whichever happened to run first.
+    """
+    for fn in candidates.values():
+        for _ in range(warmup):
+            fn()
+    timings = {name: Timing(name, loops=loops or calibrate(fn, min_run_ns)) for name, fn in candidates.items()}
+    for _ in range(repeat):
+        for name, fn in candidates.items():
+            timing = timings[name]
+            iterations = range(timing.loops)
+            start = time.perf_counter_ns()
+            for _ in iterations:
+                fn()
+            timing.runs_ns.append(time.perf_counter_ns() - start)
+    return timings
+
+
+def fastest(timings: Dict[str, Timing]) -> Tuple[str, bool]:
+    """Name of the operation with the lowest median, and whether it wins clearly.
+
+    The win is clear when even the leader's 95th percentile beats the runner-up's median;
+    otherwise the two are within run-to-run noise of each other.
+    """
+    ranked = sorted(timings.values(), key=lambda timing: timing.median)
+    clear = len(ranked) < 2 or ranked[0].p95 < ranked[1].median
+    return ranked[0].name, clear
+
+
+def sweep(sizes: Sequence[int], setup: Callable[[int], Dict[str, Callable[[], Any]]],
+          **options) -> Dict[int, Dict[str, Timing]]:
+    """compare() the operations setup(n) returns, for each n in sizes."""
+    return {n: compare(setup(n), **options) for n in sizes}
+
+
+def scaling_exponent(sizes: Sequence[int], seconds: Sequence[float]) -> float:
+    """Least-squares slope of log(time) against log(n): ~0 for O(1), ~1 for O(n), a bit over 1 for O(n log n)."""
+    points = [(math.log(n), math.log(s)) for n, s in zip(sizes, seconds) if n > 0 and s > 0]
+    if len(points) < 2:
+        return float("nan")
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        return float("nan")
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def format_sweep(results: Dict[int, Dict[str, Timing]]) -> str:
+    """Table of median times per size and operation, with each operation's scaling exponent."""
+    sizes = list(results)
+    names = list(results[sizes[0]]) if sizes else []
+    width = max([len(name) for name in names] + [10])
+    lines = [f"{'n':>10} " + " ".join(f"{name:>{width}}" for name in names)]
+    for n in sizes:
+        lines.append(f"{n:>10} " + " ".join(f"{format_seconds(results[n][name].median):>{width}}" for name in names))
+    exponents = [scaling_exponent(sizes, [results[n][name].median for n in sizes]) for name in names]
+    lines.append(f"{'~n^k, k=':>10} " + " ".join(f"{k:>{width}.2f}" for k in exponents))
+    return "\n".join(lines)